@@ -1,9 +1,8 @@
 """Haal details op voor een specifieke leerplaats ID."""
 
-import asyncio
 from pathlib import Path
 
-from stagemarkt import StagemarktClient
+from stagemarkt import StagemarktClient, run
 from stagemarkt.utils import JSONExporter
 
 
@@ -45,4 +44,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
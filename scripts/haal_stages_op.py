@@ -1,14 +1,14 @@
 """Haal alle stages op en exporteer naar Excel met specifieke kolommen."""
 
-import asyncio
 from pathlib import Path
 
 from stagemarkt import (
     Niveau,
     StagemarktClient,
     Straal,
+    run,
 )
-from stagemarkt.utils import AttrField, maak_stagemarkt_link, to_excel
+from stagemarkt.utils import AttrField, attr_paths, maak_stagemarkt_link_factory, to_excel
 
 
 async def main() -> None:
@@ -20,16 +20,15 @@ async def main() -> None:
         crebocode = 25998
         straal = Straal.KM_25
 
-        print(f"Zoeken naar stages (Niveau: {niveau.name}, Locatie: {plaats_postcode}, Straal: {straal.value}km)...")
-        print("Debug: Verzenden van verzoek naar API...")
-
-        educaties = await client.zoek_stages(
-            niveau=niveau, plaats=plaats_postcode, crebocode=crebocode, straal=straal, met_details=True
+        # De zoekparameters zijn voor elke rij gelijk; bouw de link-querystring één keer op
+        maak_link = maak_stagemarkt_link_factory(
+            niveau=niveau.value,
+            educatie_type=1,
+            straal=straal.value,
+            crebocode=crebocode,
+            plaats_postcode=plaats_postcode,
         )
 
-        print("Debug: API-antwoord ontvangen")
-        print(f"✓ {len(educaties)} educaties opgehaald")
-
         attributes = [
             ("Bedrijfsnaam", "organisatie.naam"),
             ("Straat", "adres.straat"),
@@ -42,19 +41,25 @@ async def main() -> None:
             ("Contactpersoon Naam", "contactpersoon"),
             ("Contactpersoon Tel", "telefoon"),
             AttrField("Contactpersoon Email", "emailadres").fallback("organisatie.email"),
-            AttrField("Stagemarkt Link").transform(
-                lambda educatie: maak_stagemarkt_link(
-                    educatie_id=educatie.leerplaats_id,
-                    titel=educatie.title,
-                    niveau=niveau.value,
-                    educatie_type=1,
-                    straal=straal.value,
-                    crebocode=crebocode,
-                    plaats_postcode=plaats_postcode,
-                )
-            ),
+            AttrField("Stagemarkt Link").transform(lambda educatie: maak_link(educatie.leerplaats_id, educatie.title)),
         ]
 
+        print(f"Zoeken naar stages (Niveau: {niveau.name}, Locatie: {plaats_postcode}, Straal: {straal.value}km)...")
+        print("Debug: Verzenden van verzoek naar API...")
+
+        educaties = await client.zoek_stages(
+            niveau=niveau,
+            plaats=plaats_postcode,
+            crebocode=crebocode,
+            straal=straal,
+            met_details=True,
+            # Telefoon, e-mail en contactpersoon staan alleen in de details; de link-kolom gebruikt basisvelden
+            benodigde_velden=attr_paths(attributes) | {"leerplaats_id", "title"},
+        )
+
+        print("Debug: API-antwoord ontvangen")
+        print(f"✓ {len(educaties)} educaties opgehaald")
+
         output_file = Path("stages_export.xlsx")
         to_excel(
             path=output_file,
@@ -70,4 +75,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,6 +1,5 @@
 """Voorbeeldscript dat laat zien hoe je filters gebruikt bij het zoeken naar educaties."""
 
-import asyncio
 from pathlib import Path
 
 from stagemarkt import (
@@ -9,8 +8,9 @@ from stagemarkt import (
     Niveau,
     StagemarktClient,
     Straal,
+    run,
 )
-from stagemarkt.utils import AttrField, to_excel
+from stagemarkt.utils import AttrField, attr_paths, to_excel
 
 
 async def main() -> None:
@@ -29,6 +29,16 @@ async def main() -> None:
             trefwoorden=["software"],  # Zoek naar "software" gerelateerde opleidingen
         )
 
+        # Kolommen voor de Excel-export (gebruik AttrField voor correcte types)
+        attributes = [
+            AttrField("Bedrijfsnaam").add("organisatie.naam"),
+            AttrField("Titel").add("title"),
+            AttrField("Leerweg").add("leerweg"),
+            AttrField("Plaats").add("adres.plaats"),
+            AttrField("Email").add("organisatie.email"),
+            AttrField("Website").add("organisatie.website"),
+        ]
+
         print(f"Zoeken naar stages met filters (Niveau: {niveau.name})...")
         print(f"Debug: Filters toepassen: {filters}")
         print("Debug: Verzenden van verzoek naar API...")
@@ -40,6 +50,8 @@ async def main() -> None:
             straal=straal,
             filters=filters,
             met_details=True,
+            # Alle kolommen staan al in de zoekresultaten, dus de details worden overgeslagen
+            benodigde_velden=attr_paths(attributes),
         )
 
         print("Debug: API-antwoord ontvangen")
@@ -49,16 +61,6 @@ async def main() -> None:
             print("Geen educaties gevonden met deze filters.")
             return
 
-        # Exporteer naar Excel (gebruik AttrField voor correcte types)
-        attributes = [
-            AttrField("Bedrijfsnaam").add("organisatie.naam"),
-            AttrField("Titel").add("title"),
-            AttrField("Leerweg").add("leerweg"),
-            AttrField("Plaats").add("adres.plaats"),
-            AttrField("Email").add("organisatie.email"),
-            AttrField("Website").add("organisatie.website"),
-        ]
-
         output_file = Path("stages_filtered_export.xlsx")
         to_excel(
             path=output_file,
@@ -74,4 +76,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,11 +1,11 @@
 """Zoek naar organisaties en exporteer de resultaten."""
 
-import asyncio
 from pathlib import Path
 
 from stagemarkt import (
     StagemarktClient,
     Straal,
+    run,
 )
 from stagemarkt.utils import AttrField, to_excel
 
@@ -64,4 +64,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,6 +1,8 @@
+from .cache import *
 from .client import *
 from .enums import *
 from .models import *
+from .runtime import *
 
 __all__ = (
     "Afbeelding",
@@ -27,10 +29,12 @@ __all__ = (
     "OrganisationDetailErkenning",
     "OrganisationDetailKwalificatie",
     "OrganisationDetailPerson",
+    "ResponseCache",
     "Sector",
     "SoortBedrijf",
     "StagemarktClient",
     "Straal",
     "StudyLocation",
     "Vergoeding",
+    "run",
 )
@@ -0,0 +1,287 @@
+"""Schijfcache voor ruwe API-antwoorden.
+
+``ResponseCache`` bewaart per endpoint + parameters het ruwe antwoord op schijf,
+samen met een kleine JSON-header. Elke endpoint heeft een eigen beleid
+(``short``, ``normal`` of ``long``) dat bepaalt hoe lang een antwoord vers is.
+Wanneer de API faalt, kan een verlopen antwoord nog binnen ``fallback_window``
+seconden teruggegeven worden.
+
+``MemoryCache`` is een kleine LRU-cache in het geheugen voor dezelfde ruwe
+antwoorden, zodat herhaalde detail-aanroepen binnen één proces geen verzoek
+meer doen.
+"""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar, Literal, NamedTuple
+from collections import OrderedDict
+from collections.abc import Iterable
+import contextlib
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+import time
+
+from .internals import _json
+
+__all__ = ("CachePolicy", "MemoryCache", "ResponseCache")
+
+CachePolicy = Literal["short", "normal", "long"]
+
+
+class CacheEntry(NamedTuple):
+    """Een gelezen cache-item.
+
+    Attributes
+    ----------
+    generated_at: float
+        Unix-tijdstip waarop het antwoord is opgeslagen.
+    stale_at: float
+        Unix-tijdstip waarna het antwoord niet meer vers is.
+    status: int
+        HTTP-statuscode van het opgeslagen antwoord.
+    body: bytes
+        Het ruwe antwoord.
+    etag: str | None
+        De ``ETag``-header van het antwoord, indien aanwezig.
+    last_modified: str | None
+        De ``Last-Modified``-header van het antwoord, indien aanwezig.
+    """
+
+    generated_at: float
+    stale_at: float
+    status: int
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class ResponseCache:
+    """Schijfcache voor antwoorden van de Stagemarkt API.
+
+    Parameters
+    ----------
+    directory: Path | str | None
+        Map waarin de cachebestanden worden opgeslagen.
+        Standaard ``~/.cache/stagemarkt``.
+    ttl: dict[CachePolicy, float] | None
+        Versheid per beleid in seconden. Ontbrekende beleidsregels vallen terug
+        op :attr:`DEFAULT_TTL`.
+    fallback_window: float
+        Aantal seconden na ``stale_at`` waarin een verlopen antwoord nog wordt
+        teruggegeven wanneer de API een fout geeft. Standaard één dag.
+    """
+
+    __slots__ = ("directory", "fallback_window", "ttl")
+
+    DEFAULT_TTL: ClassVar[dict[CachePolicy, float]] = {
+        "short": 60.0,
+        "normal": 60.0 * 10,
+        "long": 60.0 * 60 * 24,
+    }
+
+    def __init__(
+        self,
+        directory: Path | str | None = None,
+        *,
+        ttl: dict[CachePolicy, float] | None = None,
+        fallback_window: float = 60.0 * 60 * 24,
+    ) -> None:
+        self.directory: Path = Path(directory) if directory is not None else Path.home() / ".cache" / "stagemarkt"
+        self.ttl: dict[CachePolicy, float] = {**self.DEFAULT_TTL, **(ttl or {})}
+        self.fallback_window: float = fallback_window
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} directory={str(self.directory)!r}>"
+
+    @staticmethod
+    def key(url: str, params: Iterable[tuple[str, Any]]) -> str:
+        """Maak een cachesleutel van een endpoint en zijn parameters.
+
+        De volgorde van de parameters maakt niet uit.
+
+        Parameters
+        ----------
+        url: str
+            De URL van de endpoint.
+        params: Iterable[tuple[str, Any]]
+            De query parameters van het verzoek.
+
+        Returns
+        -------
+        str
+            Een hexadecimale sha256-hash.
+        """
+        raw = url + "?" + "&".join(f"{k}={v}" for k, v in sorted((str(k), str(v)) for k, v in params))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.cache"
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Lees een cache-item, ongeacht of het nog vers is.
+
+        Parameters
+        ----------
+        key: str
+            De sleutel uit :meth:`key`.
+
+        Returns
+        -------
+        CacheEntry | None
+            Het item, of ``None`` als het niet bestaat of onleesbaar is.
+        """
+        try:
+            raw = self._path(key).read_bytes()
+            header, _, body = raw.partition(b"\n")
+            meta: dict[str, Any] = _json.loads(header)
+            return CacheEntry(
+                meta["generated_at"],
+                meta["stale_at"],
+                meta["status"],
+                body,
+                meta.get("etag"),
+                meta.get("last_modified"),
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(
+        self,
+        key: str,
+        body: bytes,
+        *,
+        policy: CachePolicy,
+        status: int = 200,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Sla een ruw antwoord op.
+
+        Parameters
+        ----------
+        key: str
+            De sleutel uit :meth:`key`.
+        body: bytes
+            Het ruwe antwoord.
+        policy: CachePolicy
+            Het beleid dat bepaalt hoe lang het antwoord vers blijft.
+        status: int
+            HTTP-statuscode van het antwoord.
+        etag: str | None
+            De ``ETag``-header, om het antwoord later voorwaardelijk te verversen.
+        last_modified: str | None
+            De ``Last-Modified``-header, om het antwoord later voorwaardelijk te verversen.
+        """
+        now = time.time()
+        meta: dict[str, Any] = {"generated_at": now, "stale_at": now + self.ttl[policy], "status": status}
+        if etag is not None:
+            meta["etag"] = etag
+        if last_modified is not None:
+            meta["last_modified"] = last_modified
+        header = _json.dumps(meta)
+        path = self._path(key)
+        # Een cache die niet geschreven kan worden mag het verzoek niet laten falen
+        with contextlib.suppress(OSError):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Schrijf eerst naar een eigen tijdelijk bestand zodat een half geschreven item nooit gelezen
+            # wordt, ook niet als meerdere schrijvers tegelijk dezelfde sleutel opslaan
+            fd, name = tempfile.mkstemp(dir=path.parent, prefix=f"{key}.", suffix=".tmp")
+            os.close(fd)
+            tmp = Path(name)
+            try:
+                tmp.write_bytes(header + b"\n" + body)
+                tmp.replace(path)
+            except OSError:
+                tmp.unlink(missing_ok=True)
+                raise
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Geeft aan of een item nog vers is."""
+
+        return time.time() < entry.stale_at
+
+    def is_usable_stale(self, entry: CacheEntry) -> bool:
+        """Geeft aan of een verlopen item nog als terugval gebruikt mag worden."""
+
+        return time.time() < entry.stale_at + self.fallback_window
+
+    def clear(self) -> None:
+        """Verwijder alle cachebestanden uit :attr:`directory`."""
+
+        if not self.directory.is_dir():
+            return
+
+        for pattern in ("*.cache", "*.tmp"):
+            for path in self.directory.glob(pattern):
+                path.unlink(missing_ok=True)
+
+
+class MemoryCache:
+    """LRU-cache in het geheugen voor ruwe API-antwoorden.
+
+    Parameters
+    ----------
+    maxsize: int
+        Maximum aantal antwoorden; bij meer wordt het minst recent gebruikte
+        antwoord verwijderd.
+    ttl: float
+        Aantal seconden dat een antwoord bruikbaar blijft.
+    """
+
+    __slots__ = ("_items", "maxsize", "ttl")
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0) -> None:
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self._items: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} maxsize={self.maxsize} items={len(self._items)}>"
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str) -> bytes | None:
+        """Geef een opgeslagen antwoord terug, of ``None`` als het ontbreekt of verlopen is.
+
+        Parameters
+        ----------
+        key: str
+            De sleutel uit :meth:`ResponseCache.key`.
+        """
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        stale_at, body = item
+        if time.monotonic() >= stale_at:
+            del self._items[key]
+            return None
+
+        self._items.move_to_end(key)
+        return body
+
+    def set(self, key: str, body: bytes) -> None:
+        """Sla een ruw antwoord op.
+
+        Parameters
+        ----------
+        key: str
+            De sleutel uit :meth:`ResponseCache.key`.
+        body: bytes
+            Het ruwe antwoord.
+        """
+        if self.maxsize <= 0:
+            return
+
+        self._items[key] = (time.monotonic() + self.ttl, body)
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        """Verwijder alle antwoorden."""
+
+        self._items.clear()
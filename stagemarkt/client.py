@@ -1,24 +1,23 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, Self, overload
-
-from .enums import EducatieZoekType, Straal
-from .internals.http import HTTPClient
-
-if TYPE_CHECKING:
-    from aiohttp import ClientSession
-
-    from .enums import Leerweg, Niveau
-    from .models import (
-        Educatie,
-        EducatieFilters,
-        EducationDetail,
-        LocatieSuggestie,
-        OpleidingSuggestie,
-        Organisatie,
-        OrganisationDetail,
-        StudyLocation,
-    )
+from typing import Literal, Self, overload
+from collections.abc import AsyncIterator, Iterable
+
+from aiohttp import ClientSession
+
+from .cache import ResponseCache
+from .enums import EducatieZoekType, Leerweg, Niveau, Straal
+from .internals.http import HTTPClient, Transport
+from .models import (
+    Educatie,
+    EducatieFilters,
+    EducationDetail,
+    LocatieSuggestie,
+    OpleidingSuggestie,
+    Organisatie,
+    OrganisationDetail,
+    StudyLocation,
+)
 
 
 class StagemarktClient:
@@ -27,14 +26,51 @@ class StagemarktClient:
     Deze client biedt een handig interface voor het zoeken en ophalen van
     stage plaatsen, organisaties en studielocaties in Nederland.
 
+    Alle verzoeken delen één connection pool met keep-alive. Gebruik daarom één
+    client (bij voorkeur via ``async with``) voor meerdere zoekopdrachten, zoals
+    ``zoek_stages`` en ``zoek_organisaties`` na elkaar.
+
     Parameters
     ----------
     session: ClientSession | None
         Een optionele aiohttp ClientSession om te hergebruiken voor HTTP-verzoeken.
+        Een meegegeven sessie wordt niet gesloten door :meth:`afsluiten`.
+    cache: ResponseCache | None
+        Een optionele schijfcache voor API-antwoorden. Standaard ``None`` (geen cache).
+    transport: Transport
+        ``"aiohttp"`` (standaard) of ``"httpx"``. Met ``"httpx"`` gaan alle verzoeken
+        als HTTP/2-streams over één verbinding, wat vooral helpt bij ``met_details=True``.
+        Vereist de optionele extra ``http2``; ``session`` wordt dan niet gebruikt.
+    memory_cache_size: int
+        Aantal detail- en suggestie-antwoorden dat in het geheugen bewaard wordt, zodat
+        een herhaalde aanroep voor hetzelfde ID geen verzoek doet. ``0`` schakelt dit uit.
+        Standaard ``1024``.
+    memory_cache_ttl: float
+        Aantal seconden dat een antwoord in het geheugen bruikbaar blijft. Standaard ``300``.
+    max_retries: int
+        Aantal keer dat een verzoek opnieuw geprobeerd wordt wanneer de API ``429`` of
+        ``503`` teruggeeft (wachten volgens de ``Retry-After``-header), of bij een
+        verbindingsfout of time-out (0,5s, 1s, 2s, ...). Standaard ``3``.
     """
 
-    def __init__(self, session: ClientSession | None = None) -> None:
-        self.__http: HTTPClient = HTTPClient(session=session)
+    def __init__(
+        self,
+        session: ClientSession | None = None,
+        *,
+        cache: ResponseCache | None = None,
+        transport: Transport = "aiohttp",
+        memory_cache_size: int = 1024,
+        memory_cache_ttl: float = 300.0,
+        max_retries: int = 3,
+    ) -> None:
+        self.__http: HTTPClient = HTTPClient(
+            session=session,
+            cache=cache,
+            transport=transport,
+            memory_cache_size=memory_cache_size,
+            memory_cache_ttl=memory_cache_ttl,
+            max_retries=max_retries,
+        )
 
     async def __aenter__(self) -> Self:
         return self
@@ -42,13 +78,18 @@ class StagemarktClient:
     async def __aexit__(self, *_: object) -> None:
         await self.afsluiten()
 
-    async def afsluiten(self) -> None:
+    async def afsluiten(self, *, clear_cache: bool = False) -> None:
         """Sluit de client verbinding af.
 
         Dit zou aangeroepen moeten worden wanneer je klaar bent met het
         gebruiken van de client om resources correct op te ruimen.
+
+        Parameters
+        ----------
+        clear_cache: bool
+            Of de schijfcache ook geleegd moet worden (standaard: False).
         """
-        await self.__http.close()
+        await self.__http.close(clear_cache=clear_cache)
 
     @overload
     async def zoek_stages(
@@ -62,6 +103,8 @@ class StagemarktClient:
         buitenlandse_bedrijven: bool = ...,
         met_details: Literal[False] = ...,
         filters: EducatieFilters | None = ...,
+        detail_concurrency: int = ...,
+        benodigde_velden: Iterable[str] | None = ...,
     ) -> list[Educatie]: ...
 
     @overload
@@ -76,8 +119,26 @@ class StagemarktClient:
         buitenlandse_bedrijven: bool = ...,
         met_details: Literal[True] = ...,
         filters: EducatieFilters | None = ...,
+        detail_concurrency: int = ...,
+        benodigde_velden: None = ...,
     ) -> list[EducationDetail]: ...
 
+    @overload
+    async def zoek_stages(
+        self,
+        *,
+        niveau: Niveau,
+        plaats: str,
+        crebocode: int,
+        straal: Straal = ...,
+        limiet: int | None = ...,
+        buitenlandse_bedrijven: bool = ...,
+        met_details: Literal[True],
+        filters: EducatieFilters | None = ...,
+        detail_concurrency: int = ...,
+        benodigde_velden: Iterable[str],
+    ) -> list[Educatie] | list[EducationDetail]: ...
+
     async def zoek_stages(
         self,
         *,
@@ -90,6 +151,8 @@ class StagemarktClient:
         buitenlandse_bedrijven: bool = False,
         met_details: bool = False,
         filters: EducatieFilters | None = None,
+        detail_concurrency: int = 10,
+        benodigde_velden: Iterable[str] | None = None,
     ) -> list[Educatie] | list[EducationDetail]:
         """Zoek naar stage plaatsen.
 
@@ -114,11 +177,17 @@ class StagemarktClient:
             Wanneer True, wordt voor elke stage extra informatie opgehaald.
         filters: EducatieFilters | None
             Aanvullende filters. Standaard ``None``.
+        detail_concurrency: int
+            Maximum aantal gelijktijdige detail-aanroepen wanneer met_details True is (standaard: 10).
+        benodigde_velden: Iterable[str] | None
+            Attribuutpaden die je nodig hebt, bijv. ``attr_paths(kolommen)`` uit
+            :mod:`stagemarkt.utils`. Staan ze allemaal op de basis :class:`Educatie`,
+            dan worden de details overgeslagen, ook als met_details True is (standaard: None).
 
         Returns
         -------
         list[Educatie] | list[EducationDetail]
-            Lijst van stage plaatsen. Type hangt af van met_details parameter.
+            Lijst van stage plaatsen. Type hangt af van met_details en benodigde_velden.
         """
         return await self.__http.zoek_educaties(
             niveau=niveau,
@@ -130,6 +199,100 @@ class StagemarktClient:
             met_details=met_details,
             limiet=limiet,
             filters=filters,
+            detail_concurrency=detail_concurrency,
+            benodigde_velden=benodigde_velden,
+        )
+
+    @overload
+    def itereer_stages(
+        self,
+        *,
+        niveau: Niveau,
+        plaats: str,
+        crebocode: int,
+        straal: Straal | int = ...,
+        limiet: int | None = ...,
+        educatie_type: EducatieZoekType | None = ...,
+        buitenlandse_bedrijven: bool = ...,
+        met_details: Literal[False] = ...,
+        filters: EducatieFilters | None = ...,
+        detail_concurrency: int = ...,
+        benodigde_velden: Iterable[str] | None = ...,
+    ) -> AsyncIterator[Educatie]: ...
+
+    @overload
+    def itereer_stages(
+        self,
+        *,
+        niveau: Niveau,
+        plaats: str,
+        crebocode: int,
+        straal: Straal | int = ...,
+        limiet: int | None = ...,
+        educatie_type: EducatieZoekType | None = ...,
+        buitenlandse_bedrijven: bool = ...,
+        met_details: Literal[True],
+        filters: EducatieFilters | None = ...,
+        detail_concurrency: int = ...,
+        benodigde_velden: None = ...,
+    ) -> AsyncIterator[EducationDetail]: ...
+
+    @overload
+    def itereer_stages(
+        self,
+        *,
+        niveau: Niveau,
+        plaats: str,
+        crebocode: int,
+        straal: Straal | int = ...,
+        limiet: int | None = ...,
+        educatie_type: EducatieZoekType | None = ...,
+        buitenlandse_bedrijven: bool = ...,
+        met_details: Literal[True],
+        filters: EducatieFilters | None = ...,
+        detail_concurrency: int = ...,
+        benodigde_velden: Iterable[str],
+    ) -> AsyncIterator[Educatie] | AsyncIterator[EducationDetail]: ...
+
+    def itereer_stages(
+        self,
+        *,
+        niveau: Niveau,
+        plaats: str,
+        crebocode: int,
+        straal: Straal | int = Straal.KM_25,
+        limiet: int | None = 20,
+        educatie_type: EducatieZoekType | None = None,
+        buitenlandse_bedrijven: bool = False,
+        met_details: bool = False,
+        filters: EducatieFilters | None = None,
+        detail_concurrency: int = 10,
+        benodigde_velden: Iterable[str] | None = None,
+    ) -> AsyncIterator[Educatie] | AsyncIterator[EducationDetail]:
+        """Zoek naar stage plaatsen en geef ze terug zodra ze binnen zijn.
+
+        Neemt dezelfde parameters als :meth:`zoek_stages`. In plaats van te wachten
+        op alle pagina's wordt elke stage teruggegeven zodra de pagina (en eventueel
+        de details) binnen is. Handig om bijvoorbeeld met
+        :func:`~stagemarkt.utils.to_excel_async` al te exporteren tijdens het zoeken.
+
+        Yields
+        ------
+        Educatie | EducationDetail
+            Stage plaatsen. Type hangt af van met_details parameter.
+        """
+        return self.__http.itereer_educaties(
+            niveau=niveau,
+            plaats_postcode=plaats,
+            crebocode=crebocode,
+            straal=straal,
+            educatie_type=educatie_type,
+            buitenlandse_bedrijven=buitenlandse_bedrijven,
+            met_details=met_details,
+            limiet=limiet,
+            filters=filters,
+            detail_concurrency=detail_concurrency,
+            benodigde_velden=benodigde_velden,
         )
 
     async def haal_stage_detail(self, leerplaats_id: str) -> EducationDetail:
@@ -158,6 +321,7 @@ class StagemarktClient:
         filters: EducatieFilters | None = ...,
         limiet: int = ...,
         met_details: Literal[False] = ...,
+        detail_concurrency: int = ...,
     ) -> list[Organisatie]: ...
 
     @overload
@@ -171,6 +335,7 @@ class StagemarktClient:
         filters: EducatieFilters | None = ...,
         limiet: int = ...,
         met_details: Literal[True] = ...,
+        detail_concurrency: int = ...,
     ) -> list[OrganisationDetail]: ...
 
     async def zoek_organisaties(
@@ -183,6 +348,7 @@ class StagemarktClient:
         filters: EducatieFilters | None = None,
         limiet: int = 20,
         met_details: bool = False,
+        detail_concurrency: int = 10,
     ) -> list[Organisatie] | list[OrganisationDetail]:
         """Zoek naar organisaties die stages aanbieden.
 
@@ -199,6 +365,8 @@ class StagemarktClient:
         met_details: bool
             Of gedetailleerde informatie moet worden opgehaald (standaard: False).
             Wanneer True, wordt voor elke organisatie extra informatie opgehaald.
+        detail_concurrency: int
+            Maximum aantal gelijktijdige detail-aanroepen wanneer met_details True is (standaard: 10).
 
         Returns
         -------
@@ -213,6 +381,68 @@ class StagemarktClient:
             filters=filters,
             met_details=met_details,
             limiet=limiet,
+            detail_concurrency=detail_concurrency,
+        )
+
+    @overload
+    def itereer_organisaties(
+        self,
+        *,
+        plaats: str,
+        crebocode: int,
+        straal: Straal = ...,
+        leerweg: Leerweg | None = ...,
+        filters: EducatieFilters | None = ...,
+        limiet: int = ...,
+        met_details: Literal[False] = ...,
+        detail_concurrency: int = ...,
+    ) -> AsyncIterator[Organisatie]: ...
+
+    @overload
+    def itereer_organisaties(
+        self,
+        *,
+        plaats: str,
+        crebocode: int,
+        straal: Straal = ...,
+        leerweg: Leerweg | None = ...,
+        filters: EducatieFilters | None = ...,
+        limiet: int = ...,
+        met_details: Literal[True],
+        detail_concurrency: int = ...,
+    ) -> AsyncIterator[OrganisationDetail]: ...
+
+    def itereer_organisaties(
+        self,
+        *,
+        plaats: str,
+        crebocode: int,
+        straal: Straal = Straal.KM_25,
+        leerweg: Leerweg | None = None,
+        filters: EducatieFilters | None = None,
+        limiet: int = 20,
+        met_details: bool = False,
+        detail_concurrency: int = 10,
+    ) -> AsyncIterator[Organisatie] | AsyncIterator[OrganisationDetail]:
+        """Zoek naar organisaties en geef ze terug zodra ze binnen zijn.
+
+        Neemt dezelfde parameters als :meth:`zoek_organisaties`, maar geeft elke
+        organisatie terug zodra de pagina (en eventueel de details) binnen is.
+
+        Yields
+        ------
+        Organisatie | OrganisationDetail
+            Organisaties. Type hangt af van met_details parameter.
+        """
+        return self.__http.itereer_organisaties(
+            plaats_postcode=plaats,
+            crebocode=crebocode,
+            straal=straal,
+            leerweg=leerweg,
+            filters=filters,
+            met_details=met_details,
+            limiet=limiet,
+            detail_concurrency=detail_concurrency,
         )
 
     async def haal_organisatie_detail(self, organisatie_id: str) -> OrganisationDetail:
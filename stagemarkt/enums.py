@@ -1,5 +1,6 @@
 from typing import Self
-from enum import Enum
+from enum import IntEnum, StrEnum
+from functools import lru_cache
 
 __all__ = (
     "EducatieZoekType",
@@ -14,33 +15,34 @@ __all__ = (
 )
 
 
-class FileType(Enum):
+class FileType(StrEnum):
     EXCEL = "xlsx"
     HTML = "html"
     JSON = "json"
 
     @classmethod
+    @lru_cache(maxsize=16)
     def from_extension(cls, ext: str) -> Self:
         return cls(ext.removeprefix("."))
 
 
-class LocatieType(Enum):
+class LocatieType(StrEnum):
     PLAATS = "Plaats"
     REGIO = "Regio"
     POSTCODE = "Postcode"
 
 
-class Leerweg(Enum):
+class Leerweg(StrEnum):
     BBL = "acf992a3-efee-4537-9275-9e6b1b7a8fe3"
     BOL = "2468c1a0-ad7b-4209-b27b-b12ae0e3d1d2"
 
 
-class EducatieZoekType(Enum):
+class EducatieZoekType(IntEnum):
     STAGE = 1
     LEERBAAN = 2
 
 
-class Kenmerk(Enum):
+class Kenmerk(StrEnum):
     BEGELEIDING_OP_MAAT = "fb16c3ec-9641-e911-a965-000d3a38ad05"
     FYSIEKE_TOEGANKELIJKHEID = "467acfda-9641-e911-a965-000d3a38ad05"
     VASTE_BAAN = "6293559d-90fe-eb11-94ef-00224880e5e5"
@@ -48,12 +50,12 @@ class Kenmerk(Enum):
     PRAKTIJKVERKLARING = "76b79697-89fe-eb11-94ef-00224880e5e5"
 
 
-class Sector(Enum):
+class Sector(StrEnum):
     ICT = "87c539b1-192b-4418-be0e-01e2df29bee7"
     ZORG_EN_WELZIJN = "0dd6dc35-bcc9-4042-b80b-7b091dae99bc"
 
 
-class SoortBedrijf(Enum):
+class SoortBedrijf(StrEnum):
     GROOTHANDEL_COMPUTERS = "08aa4f5e-b356-e011-87cd-001372415b01"
     SOFTWARE_ONTWIKKELING = "2eab4f5e-b356-e011-87cd-001372415b01"
     GEGEVENSVERWERKING = "34ab4f5e-b356-e011-87cd-001372415b01"
@@ -66,7 +68,7 @@ class SoortBedrijf(Enum):
     UITGEVERIJEN_TIJDSCHRIFTEN = "0fab4f5e-b356-e011-87cd-001372415b01"
 
 
-class Niveau(Enum):
+class Niveau(IntEnum):
     """MBO niveau van 1 tot en met 4."""
 
     MBO_1 = 1
@@ -75,7 +77,7 @@ class Niveau(Enum):
     MBO_4 = 4
 
 
-class Straal(Enum):
+class Straal(IntEnum):
     KM_5 = 5
     KM_10 = 10
     KM_15 = 15
@@ -0,0 +1,22 @@
+"""Parsen van ISO 8601-datums uit API-antwoorden.
+
+Veel resultaten in één antwoord delen dezelfde datumstring (bijv. ``startdatum``),
+daarom wordt het resultaat per string gecachet.
+"""
+
+from __future__ import annotations
+
+import datetime
+from functools import lru_cache
+
+__all__ = ("parse_iso",)
+
+
+@lru_cache(maxsize=4096)
+def parse_iso(value: str) -> datetime.datetime:
+    """Parse een ISO 8601-datum of -datum/tijd naar een naïeve :class:`datetime.datetime`.
+
+    Een afsluitende ``Z`` wordt genegeerd, zodat het resultaat naïef blijft.
+    """
+
+    return datetime.datetime.fromisoformat(value.removesuffix("Z"))
@@ -0,0 +1,56 @@
+"""JSON (de)serialisatie via ``orjson`` wanneer beschikbaar, anders via de standaardbibliotheek.
+
+``orjson`` is een optionele afhankelijkheid (``pip install stagemarkt-api[speed]``).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+import contextlib
+from functools import cache
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ("HAS_ORJSON", "dumps", "loads", "uses_orjson")
+
+HAS_ORJSON: bool = orjson is not None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decodeer JSON uit bytes of een string."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@cache
+def _encoder(*, indent: int | None, ensure_ascii: bool) -> json.JSONEncoder:
+    # ``json.dumps`` maakt bij niet-standaard opties per aanroep een nieuwe encoder;
+    # exports encoderen per object, dus hergebruik er één per combinatie van opties
+    return json.JSONEncoder(indent=indent, ensure_ascii=ensure_ascii)
+
+
+def uses_orjson(*, indent: int | None = None, ensure_ascii: bool = False) -> bool:
+    """Geeft aan of :func:`dumps` met deze opties via ``orjson`` encodeert."""
+
+    return HAS_ORJSON and not ensure_ascii and indent in {None, 2}
+
+
+def dumps(obj: Any, *, indent: int | None = None, ensure_ascii: bool = False) -> bytes:
+    """Encodeer een JSON-compatibele waarde naar UTF-8 bytes.
+
+    ``orjson`` ondersteunt alleen compacte uitvoer of een inspringing van 2 en
+    escapet nooit non-ASCII; voor andere opties wordt de standaardbibliotheek
+    gebruikt.
+    """
+
+    if orjson is not None and uses_orjson(indent=indent, ensure_ascii=ensure_ascii):
+        # Bijv. integers buiten 64 bit kan orjson niet aan; de standaardbibliotheek wel
+        with contextlib.suppress(orjson.JSONEncodeError):
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent == 2 else 0)
+    return _encoder(indent=indent, ensure_ascii=ensure_ascii).encode(obj).encode("utf-8")
@@ -3,16 +3,29 @@ from __future__ import annotations
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Generic,
+    Literal,
+    NamedTuple,
     Protocol,
     TypedDict,
 )
 import asyncio
+import contextlib
+import datetime
+from email.utils import parsedate_to_datetime
 from functools import partial
+import itertools
+import math
 import random
+from types import MappingProxyType
 
 import aiohttp
+from aiohttp.connector import NEEDS_CLEANUP_CLOSED
+from multidict import CIMultiDict, CIMultiDictProxy
+import yarl
 
+from ..cache import CachePolicy, MemoryCache, ResponseCache
 from ..enums import EducatieZoekType, Leerweg, Niveau, Straal
 from ..models import (
     Educatie,
@@ -24,6 +37,22 @@ from ..models import (
     OrganisationDetail,
     StudyLocation,
 )
+from . import _json
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    from aiohttp.compression_utils import HAS_ZSTD as _AIOHTTP_ZSTD
+except ImportError:
+    _AIOHTTP_ZSTD = False
 
 if TYPE_CHECKING:
     from _types.educatie_detail import EducationDetail as EducationDetailPayload
@@ -44,7 +73,7 @@ if TYPE_CHECKING:
     from _types.study_location import StudyLocationResult as StudyLocationResultPayload
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import AsyncIterator, Callable, Coroutine, Iterable, Mapping
 
 from typing import TypeVar
 
@@ -54,6 +83,85 @@ ItemT = TypeVar("ItemT")
 DataT = TypeVar("DataT")  # No bound; accepts any response dict-like type
 
 
+Transport = Literal["aiohttp", "httpx"]
+
+
+_USER_AGENTS: tuple[str, ...] = (
+    ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"),
+    (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/130.0.0.0 Safari/537.36 Edg/130.0.0.0"
+    ),
+    (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/131.0.0.0 Safari/537.36"
+    ),
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:133.0) Gecko/20100101 Firefox/133.0",
+    (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.1 Safari/605.1.15"
+    ),
+)
+# Elke nieuwe sessie gebruikt de volgende user-agent
+_USER_AGENT_CYCLE = itertools.cycle(_USER_AGENTS)
+
+# zstd wordt alleen geadverteerd als de transport het antwoord ook kan uitpakken:
+# aiohttp via `compression.zstd`/`backports.zstd`, httpx via `zstandard`
+_ACCEPT_ENCODING = "gzip, deflate, br"
+_ACCEPT_ENCODING_ZSTD = "gzip, deflate, br, zstd"
+
+
+# Antwoord dat de API bedoelt wanneer ze een 500 geeft bij lege locatiesuggesties
+_LEGE_LOCATIES = b'{"status": 500, "body": {"data": []}}'
+
+
+# Statussen waarmee de server aangeeft dat we later opnieuw moeten proberen
+_OPNIEUW_STATUSSEN = frozenset({429, 503})
+_MAX_WACHTTIJD = 60.0
+
+# Zodat één vastgelopen verbinding niet een hele `asyncio.gather` ophoudt
+_TIMEOUT_TOTAAL = 30.0
+_TIMEOUT_VERBINDEN = 5.0
+_TIMEOUT_LEZEN = 15.0
+
+
+def _backoff(poging: int) -> float:
+    """Wachttijd na een verbindingsfout of time-out: 0,5s, 1s, 2s, ... met wat willekeurige spreiding."""
+
+    return 0.5 * 2 ** (poging - 1) + random.uniform(0, 0.1)
+
+
+def _wachttijd(headers: Any, poging: int) -> float:
+    """Aantal seconden om te wachten volgens ``Retry-After``, anders exponentieel oplopend."""
+
+    waarde = headers.get("Retry-After") if headers else None
+    if waarde:
+        with contextlib.suppress(ValueError):
+            seconden = float(waarde)
+            # "nan" en "inf" worden door float() geaccepteerd maar zijn geen geldige wachttijd
+            if math.isfinite(seconden):
+                return min(max(seconden, 0.0), _MAX_WACHTTIJD)
+        with contextlib.suppress(TypeError, ValueError):
+            moment = parsedate_to_datetime(waarde)
+            seconden = (moment - datetime.datetime.now(datetime.UTC)).total_seconds()
+            return min(max(seconden, 0.0), _MAX_WACHTTIJD)
+    return min(float(2 ** (poging - 1)), _MAX_WACHTTIJD)
+
+
+class _Antwoord(NamedTuple):
+    status: int
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+
+
+def _alleen_basisvelden(velden: Iterable[str]) -> bool:
+    # Het eerste deel van elk pad moet een attribuut of property van de basis-`Educatie` zijn
+    return all(hasattr(Educatie, veld.partition(".")[0]) for veld in velden)
+
+
 class MinimalCallable[T](Protocol):
     def __call__(self, *, page_size: int, page: int) -> Coroutine[Any, Any, T]: ...
 
@@ -68,6 +176,18 @@ class MinimalData(TypedDict, total=False):
 
 
 class Paginator[ItemT, DataT]:
+    __slots__ = (
+        "__count",
+        "concurrency",
+        "current_page",
+        "has_more",
+        "items_key",
+        "limit",
+        "max_page_size",
+        "page_delay",
+        "requester",
+    )
+
     def __init__(
         self,
         requester: MinimalCallable[Any],
@@ -75,6 +195,8 @@ class Paginator[ItemT, DataT]:
         limit: int | None = None,
         max_page_size: int = 20,
         items_key: str = "items",
+        concurrency: int = 4,
+        page_delay: float = 0.0,
     ) -> None:
         self.current_page: int = 1
         self.has_more: bool = True
@@ -83,44 +205,110 @@ class Paginator[ItemT, DataT]:
         self.items_key: str = items_key
 
         self.max_page_size: int = max_page_size
+        # Maximum aantal pagina's dat `collect` tegelijk ophaalt
+        self.concurrency: int = concurrency
+        # Wachttijd tussen pagina's in seconden; met een wachttijd haalt `collect` de pagina's na elkaar op
+        self.page_delay: float = page_delay
 
-        self.__items: list[ItemT] = []
+        self.__count: int = 0
 
-    async def collect(self) -> list[ItemT]:
-        page_size = max(
+    def __page_size(self) -> int:
+        return max(
             1,
             min(
                 self.max_page_size,
-                self.limit - len(self.__items) if self.limit is not None else self.max_page_size,
+                self.limit - self.__count if self.limit is not None else self.max_page_size,
             ),
         )
+
+    def __take(self, response: dict[str, Any]) -> list[ItemT]:
+        items: list[ItemT] = response.get(self.items_key, [])
+        if self.limit is not None:
+            items = items[: max(self.limit - self.__count, 0)]
+        self.__count += len(items)
+        return items
+
+    def __advance(self, response: dict[str, Any]) -> bool:
+        if self.limit is not None and self.__count >= self.limit:
+            self.has_more = False
+            return False
+
+        # Prefer hasNextPage if available, else fallback to page counting
+        has_next = response.get("hasNextPage")
+        if has_next is not None:
+            self.has_more = bool(has_next)
+        else:
+            total_pages: int = response.get("totalPages", 1)
+            self.has_more = self.current_page < total_pages
+
+        if self.has_more:
+            self.current_page += 1
+        return self.has_more
+
+    async def pages(self) -> AsyncIterator[list[ItemT]]:
+        """Haal de pagina's één voor één op en geef per pagina de items terug.
+
+        Hiermee kan een aanroeper al met de eerste pagina verder terwijl de
+        volgende nog opgehaald moeten worden.
+        """
+        page_size = self.__page_size()
         while self.has_more:
             response: dict[str, Any] = await self.requester(
                 page_size=page_size,
                 page=self.current_page,
             )
-            items: list[ItemT] = response.get(self.items_key, [])
-            self.__items.extend(items)
+            yield self.__take(response)
 
-            if self.limit is not None and len(self.__items) >= self.limit:
-                self.has_more = False
+            if not self.__advance(response):
                 break
 
-            # Prefer hasNextPage if available, else fallback to page counting
-            has_next = response.get("hasNextPage")
-            if has_next is not None:
-                self.has_more = bool(has_next)
-            else:
-                total_pages: int = response.get("totalPages", 1)
-                self.has_more = self.current_page < total_pages
+            if self.page_delay:
+                await asyncio.sleep(self.page_delay)
 
-            if not self.has_more:
-                break
+    async def collect(self) -> list[ItemT]:
+        """Haal alle pagina's op en geef de items in volgorde terug.
 
-            self.current_page += 1
-            await asyncio.sleep(1)
+        De eerste pagina vertelt hoeveel pagina's er zijn; de rest wordt daarna
+        tegelijk opgehaald (maximaal :attr:`concurrency` tegelijk). Zonder
+        `totalPages`/`totalCount` in het antwoord, of met een `page_delay`, gaat
+        het pagina voor pagina.
+        """
+        page_size = self.__page_size()
+        response: dict[str, Any] = await self.requester(page_size=page_size, page=self.current_page)
+        # Bewaar de items per pagina en voeg ze pas aan het eind in één keer samen
+        pages: list[list[ItemT]] = [self.__take(response)]
+
+        total_pages: int | None = response.get("totalPages")
+        if total_pages is None and (total_count := response.get("totalCount")) is not None:
+            total_pages = -(-total_count // page_size)
 
-        return self.__items
+        if total_pages is None or self.page_delay:
+            while self.__advance(response):
+                if self.page_delay:
+                    await asyncio.sleep(self.page_delay)
+                response = await self.requester(page_size=page_size, page=self.current_page)
+                pages.append(self.__take(response))
+            return list(itertools.chain.from_iterable(pages))
+
+        if not self.__advance(response):
+            return pages[0].copy()
+
+        last_page = total_pages
+        if self.limit is not None:
+            last_page = min(last_page, self.current_page - 1 + -(-(self.limit - self.__count) // page_size))
+
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def fetch(page: int) -> dict[str, Any]:
+            async with semaphore:
+                return await self.requester(page_size=page_size, page=page)
+
+        responses = await asyncio.gather(*(fetch(page) for page in range(self.current_page, last_page + 1)))
+        pages.extend(self.__take(page_response) for page_response in responses)
+
+        self.current_page = max(self.current_page, last_page)
+        self.has_more = False
+        return list(itertools.chain.from_iterable(pages))
 
 
 class HTTPClient:
@@ -133,36 +321,20 @@ class HTTPClient:
     EDUCATION_DETAIL_URL = f"{BASE_URL}/education-detail"
     ORGANIZATION_DETAIL_URL = f"{BASE_URL}/organization-detail"
 
-    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
-        self.__session: aiohttp.ClientSession | None = session
-
-    def _generate_base_headers(self) -> dict[str, Any]:
-        user_agents = [
-            (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/131.0.0.0 Safari/537.36"
-            ),
-            (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/130.0.0.0 Safari/537.36 Edg/130.0.0.0"
-            ),
-            (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/131.0.0.0 Safari/537.36"
-            ),
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:133.0) Gecko/20100101 Firefox/133.0",
-            (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.1 Safari/605.1.15"
-            ),
-        ]
+    __slots__ = (
+        "__httpx",
+        "__inflight",
+        "__owns_session",
+        "__session",
+        "cache",
+        "max_retries",
+        "memory_cache",
+        "transport",
+    )
 
-        return {
+    _BASE_HEADERS: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
             "Accept": "application/json, text/plain, */*",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
             "Accept-Language": "nl-NL,nl;q=0.9,en;q=0.8",
             "Referer": "https://stagemarkt.nl/",
             "Sec-CH-UA": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
@@ -171,7 +343,42 @@ class HTTPClient:
             "Sec-Fetch-Dest": "empty",
             "Sec-Fetch-Mode": "cors",
             "Sec-Fetch-Site": "same-origin",
-            "User-Agent": random.choice(user_agents),
+        }
+    )
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | None = None,
+        *,
+        cache: ResponseCache | None = None,
+        transport: Transport = "aiohttp",
+        memory_cache_size: int = 1024,
+        memory_cache_ttl: float = 300.0,
+        max_retries: int = 3,
+    ) -> None:
+        if transport == "httpx" and httpx is None:
+            msg = "De 'httpx' transport vereist httpx, installeer met: pip install stagemarkt-api[http2]"
+            raise RuntimeError(msg)
+
+        self.__session: aiohttp.ClientSession | None = session
+        # Een sessie die van buitenaf is meegegeven wordt niet door ons gesloten
+        self.__owns_session: bool = session is None
+        self.__httpx: httpx.AsyncClient | None = None
+        self.transport: Transport = transport
+        self.cache: ResponseCache | None = cache
+        # Antwoorden met beleid "normal" of "long" (details, suggesties) blijven kort in het geheugen
+        self.memory_cache: MemoryCache = MemoryCache(maxsize=memory_cache_size, ttl=memory_cache_ttl)
+        # Aantal herhaalpogingen bij 429/503, verbindingsfouten en time-outs
+        self.max_retries: int = max_retries
+        # Lopende detail-verzoeken per (endpoint, id), zodat gelijktijdige aanroepen er één delen
+        self.__inflight: dict[tuple[str, str], asyncio.Future[tuple[bytes, Any]]] = {}
+
+    def _generate_base_headers(self) -> dict[str, Any]:
+        zstd = zstandard is not None if self.transport == "httpx" else _AIOHTTP_ZSTD
+        return {
+            **self._BASE_HEADERS,
+            "Accept-Encoding": _ACCEPT_ENCODING_ZSTD if zstd else _ACCEPT_ENCODING,
+            "User-Agent": next(_USER_AGENT_CYCLE),
         }
 
     def get_base_params(
@@ -185,12 +392,13 @@ class HTTPClient:
         base: dict[str, Any] = {
             "siteId": "STAGEMARKT",
         }
+        # Niveau en Straal zijn IntEnums en kunnen direct als query parameter gebruikt worden
         if niveau is not None:
-            base["niveau"] = niveau.value
+            base["niveau"] = niveau
         if plaats_postcode is not None:
             base["plaatsPostcode"] = plaats_postcode
         if straal is not None:
-            base["range"] = straal if isinstance(straal, int) else straal.value
+            base["range"] = straal
         if crebocode is not None:
             base["crebocode"] = crebocode
         return base
@@ -198,15 +406,219 @@ class HTTPClient:
     async def get_session(self) -> aiohttp.ClientSession:
         if self.__session is None or self.__session.closed:
             headers = self._generate_base_headers()
-            self.__session = aiohttp.ClientSession(headers=headers)
+            # Eén connection pool met keep-alive zodat TCP/TLS over alle verzoeken wordt hergebruikt
+            connector = aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                # Alleen nodig op Python-versies met het lek in afgebroken SSL-verbindingen; anders waarschuwt aiohttp
+                enable_cleanup_closed=NEEDS_CLEANUP_CLOSED,
+            )
+            timeout = aiohttp.ClientTimeout(total=_TIMEOUT_TOTAAL, connect=_TIMEOUT_VERBINDEN, sock_read=_TIMEOUT_LEZEN)
+            self.__session = aiohttp.ClientSession(
+                headers=headers,
+                connector=connector,
+                timeout=timeout,
+                raise_for_status=False,
+            )
+            self.__owns_session = True
         return self.__session
 
-    async def close(self) -> None:
-        if self.__session and not self.__session.closed:
+    def get_httpx_client(self) -> httpx.AsyncClient:
+        if self.__httpx is None or self.__httpx.is_closed:
+            # HTTP/2 wordt via ALPN onderhandeld; ondersteunt de server het niet, dan valt httpx terug op HTTP/1.1
+            self.__httpx = httpx.AsyncClient(
+                headers=self._generate_base_headers(),
+                http2=True,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=75),
+                timeout=httpx.Timeout(_TIMEOUT_LEZEN, connect=_TIMEOUT_VERBINDEN),
+            )
+        return self.__httpx
+
+    async def close(self, *, clear_cache: bool = False) -> None:
+        if self.__owns_session and self.__session and not self.__session.closed:
             await self.__session.close()
 
         self.__session = None
 
+        if self.__httpx is not None:
+            await self.__httpx.aclose()
+            self.__httpx = None
+
+        self.memory_cache.clear()
+
+        if clear_cache and self.cache is not None:
+            self.cache.clear()
+
+    async def request(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | list[tuple[str, Any]],
+        policy: CachePolicy | None = None,
+    ) -> Any:
+        """Voer een GET-verzoek uit en geef de gedecodeerde JSON terug.
+
+        Antwoorden met beleid ``"normal"`` of ``"long"`` worden eerst in
+        :attr:`memory_cache` gezocht. Wanneer er een cache is ingesteld en
+        ``policy`` niet ``None`` is, wordt daarna een vers antwoord uit de cache
+        teruggegeven zonder verzoek. Een verlopen antwoord wordt met
+        ``If-None-Match``/``If-Modified-Since`` opnieuw gevalideerd; bij
+        ``304 Not Modified`` wordt het opgeslagen antwoord hergebruikt. Faalt het
+        verzoek, dan wordt een verlopen antwoord binnen het terugvalvenster
+        gebruikt.
+        """
+        _, data = await self.__request(url, params=params, policy=policy)
+        return data
+
+    async def __request(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | list[tuple[str, Any]],
+        policy: CachePolicy | None,
+    ) -> tuple[bytes, Any]:
+        # Geeft naast de gedecodeerde JSON ook de ruwe body terug, zie `__gedeeld`
+        param_items = list(params.items()) if isinstance(params, dict) else params
+
+        cache = self.cache if policy is not None else None
+        memory_cache = self.memory_cache if policy in {"normal", "long"} else None
+        key: str | None = None
+        if cache is not None or memory_cache is not None:
+            key = ResponseCache.key(url, param_items)
+
+        if memory_cache is not None and key is not None and (body := memory_cache.get(key)) is not None:
+            # Elke aanroep decodeert opnieuw, zodat aanroepers nooit hetzelfde dict delen
+            return body, _json.loads(body)
+
+        entry = None
+        if cache is not None and key is not None:
+            # Schijf-I/O buiten de event loop, zodat andere verzoeken niet wachten
+            entry = await asyncio.to_thread(cache.get, key)
+            if entry is not None and cache.is_fresh(entry):
+                if memory_cache is not None:
+                    memory_cache.set(key, entry.body)
+                return entry.body, _json.loads(entry.body)
+
+        conditional: dict[str, str] = {}
+        if entry is not None:
+            if entry.etag:
+                conditional["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                conditional["If-Modified-Since"] = entry.last_modified
+
+        try:
+            antwoord = await self.__get(url, param_items, conditional)
+        except (aiohttp.ClientError, TimeoutError):
+            if cache is not None and entry is not None and cache.is_usable_stale(entry):
+                return entry.body, _json.loads(entry.body)
+            raise
+
+        status, body, etag, last_modified = antwoord
+        if status == 304 and entry is not None:
+            # Ongewijzigd: hergebruik het opgeslagen antwoord en ververs alleen de versheid
+            status, body = entry.status, entry.body
+            etag = etag or entry.etag
+            last_modified = last_modified or entry.last_modified
+
+        data = _json.loads(body)
+        if cache is not None and key is not None and policy is not None:
+            await asyncio.to_thread(
+                cache.set, key, body, policy=policy, status=status, etag=etag, last_modified=last_modified
+            )
+        if memory_cache is not None and key is not None:
+            memory_cache.set(key, body)
+        return body, data
+
+    async def __get(self, url: str, params: list[tuple[str, Any]], headers: dict[str, str]) -> _Antwoord:
+        get = self.__get_httpx if self.transport == "httpx" else self.__get_aiohttp
+        poging = 0
+        while True:
+            try:
+                return await get(url, params, headers)
+            except aiohttp.ClientResponseError as exc:
+                poging += 1
+                if exc.status not in _OPNIEUW_STATUSSEN or poging > self.max_retries:
+                    raise
+                await asyncio.sleep(_wachttijd(exc.headers, poging))
+            except (aiohttp.ClientConnectionError, TimeoutError):
+                poging += 1
+                if poging > self.max_retries:
+                    raise
+                await asyncio.sleep(_backoff(poging))
+
+    async def __get_aiohttp(self, url: str, params: list[tuple[str, Any]], headers: dict[str, str]) -> _Antwoord:
+        session = await self.get_session()
+        async with session.get(url, params=params, headers=headers or None) as resp:
+            resp.raise_for_status()
+            body = await resp.read()
+            return _Antwoord(resp.status, body, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+
+    async def __get_httpx(self, url: str, params: list[tuple[str, Any]], headers: dict[str, str]) -> _Antwoord:
+        client = self.get_httpx_client()
+        # Zet httpx-fouten om naar dezelfde uitzonderingen als bij aiohttp, zodat
+        # foutafhandeling en de cache-terugval voor beide transports gelijk zijn
+        try:
+            resp = await client.get(url, params=params, headers=headers or None)
+        except httpx.TimeoutException as exc:
+            raise TimeoutError(str(exc)) from exc
+        except httpx.TransportError as exc:
+            raise aiohttp.ClientConnectionError(str(exc)) from exc
+
+        if resp.is_error:
+            resp_url = yarl.URL(str(resp.url))
+            request_info = aiohttp.RequestInfo(
+                url=resp_url,
+                method=resp.request.method,
+                headers=CIMultiDictProxy(CIMultiDict(resp.request.headers.multi_items())),
+                real_url=resp_url,
+            )
+            raise aiohttp.ClientResponseError(
+                request_info,
+                (),
+                status=resp.status_code,
+                message=resp.reason_phrase,
+                headers=CIMultiDictProxy(CIMultiDict(resp.headers.multi_items())),
+            )
+        return _Antwoord(resp.status_code, resp.content, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+
+    async def __gedeeld(self, sleutel: tuple[str, str], url: str, params: dict[str, Any]) -> Any:
+        # Annuleren door één aanroeper mag het gedeelde verzoek niet voor de anderen afbreken
+        bezig = self.__inflight.get(sleutel)
+        if bezig is not None:
+            # Meelezers decoderen de ruwe body zelf, zodat aanroepers nooit hetzelfde dict delen
+            body, _ = await asyncio.shield(bezig)
+            return _json.loads(body)
+
+        bezig = asyncio.ensure_future(self.__request(url, params=params, policy="normal"))
+        self.__inflight[sleutel] = bezig
+        bezig.add_done_callback(partial(self.__klaar, sleutel))
+        _, data = await asyncio.shield(bezig)
+        return data
+
+    def __klaar(self, sleutel: tuple[str, str], bezig: asyncio.Future[tuple[bytes, Any]]) -> None:
+        self.__inflight.pop(sleutel, None)
+        # Haal de fout op, anders meldt asyncio "exception was never retrieved" als alle aanroepers geannuleerd zijn
+        if not bezig.cancelled():
+            bezig.exception()
+
+    async def __haal_details[PayloadT, DetailT](
+        self,
+        items: list[PayloadT],
+        *,
+        haal_op: Callable[[PayloadT], Coroutine[Any, Any, DetailT]],
+        gelijktijdig: int,
+    ) -> list[DetailT]:
+        semaphore = asyncio.Semaphore(max(1, gelijktijdig))
+
+        async def begrensd(item: PayloadT) -> DetailT:
+            async with semaphore:
+                return await haal_op(item)
+
+        return await asyncio.gather(*(begrensd(item) for item in items))
+
     async def haal_locaties(self, *, term: str) -> LocatieSuggestie:
         """Haal locatiesuggesties op voor een gegeven zoekterm.
 
@@ -220,18 +632,20 @@ class HTTPClient:
         LocatieSuggestie
             Locatiesuggesties die overeenkomen met de zoekterm.
         """
-        session = await self.get_session()
         params: dict[str, Any] = self.get_base_params()
         params["term"] = term
 
-        async with session.get(self.LOCATIE_SUGGESTIES_URL, params=params) as resp:
-            if resp.status == 500:
-                # Soms geeft de API een 500 terug bij lege resultaten
-                return LocatieSuggestie({"status": 500, "body": {"data": []}})
-
-            resp.raise_for_status()
-            data = await resp.json()
-            return LocatieSuggestie(data)
+        try:
+            data = await self.request(self.LOCATIE_SUGGESTIES_URL, params=params, policy="long")
+        except aiohttp.ClientResponseError as exc:
+            if exc.status == 500:
+                # Soms geeft de API een 500 terug bij lege resultaten; onthoud dat voor
+                # deze term zodat herhaalde zoekopdrachten geen nieuw verzoek doen
+                key = ResponseCache.key(self.LOCATIE_SUGGESTIES_URL, params.items())
+                self.memory_cache.set(key, _LEGE_LOCATIES)
+                return LocatieSuggestie(_json.loads(_LEGE_LOCATIES))
+            raise
+        return LocatieSuggestie(data)
 
     async def __get_educations(
         self,
@@ -240,16 +654,10 @@ class HTTPClient:
         page: int,
         params: list[tuple[str, Any]],
     ) -> EducatieSearchResultPayload:
-        session = await self.get_session()
         # Maak een kopie om te voorkomen dat params hergebruikt worden
         request_params = [*params, ("pageSize", page_size), ("page", page)]
 
-        async with session.get(
-            self.EDUCATION_SEARCH_URL,
-            params=request_params,
-        ) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+        return await self.request(self.EDUCATION_SEARCH_URL, params=request_params, policy="short")
 
     async def __get_organisaties(
         self,
@@ -258,35 +666,23 @@ class HTTPClient:
         page: int,
         params: list[tuple[str, Any]],
     ) -> OrganisationSearchResultPayload:
-        session = await self.get_session()
         request_params: list[tuple[str, Any]] = [
             *params,
             ("pageSize", page_size),
             ("page", page),
         ]
 
-        async with session.get(
-            self.ORGANISATION_SEARCH_URL,
-            params=request_params,
-        ) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+        return await self.request(self.ORGANISATION_SEARCH_URL, params=request_params, policy="short")
 
     async def __get_education_detail(
         self,
         *,
         leerplaats_id: str,
     ) -> EducationDetailPayload:
-        session = await self.get_session()
         params: dict[str, Any] = self.get_base_params()
         params["id"] = leerplaats_id
 
-        async with session.get(
-            self.EDUCATION_DETAIL_URL,
-            params=params,
-        ) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+        return await self.__gedeeld((self.EDUCATION_DETAIL_URL, leerplaats_id), self.EDUCATION_DETAIL_URL, params)
 
     async def __get_study_locations(
         self,
@@ -295,36 +691,26 @@ class HTTPClient:
         lat: float,
         lon: float,
     ) -> list[StudyLocationResultPayload]:
-        session = await self.get_session()
         params: dict[str, Any] = {
             "crebo": crebocode,
             "lat": lat,
             "lon": lon,
         }
 
-        async with session.get(
-            self.STUDY_LOCATIONS_URL,
-            params=params,
-        ) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+        return await self.request(self.STUDY_LOCATIONS_URL, params=params, policy="long")
 
     async def __get_organization_detail(
         self,
         *,
         organization_id: str,
     ) -> OrganisationDetailPayload:
-        session = await self.get_session()
         params: dict[str, Any] = self.get_base_params()
         params["id"] = organization_id
 
-        async with session.get(
-            self.ORGANIZATION_DETAIL_URL,
-            params=params,
-        ) as resp:
-            resp.raise_for_status()
-            data: OrganisationDetailPayload = await resp.json()
-            return data
+        data: OrganisationDetailPayload = await self.__gedeeld(
+            (self.ORGANIZATION_DETAIL_URL, organization_id), self.ORGANIZATION_DETAIL_URL, params
+        )
+        return data
 
     async def zoek_organisaties(
         self,
@@ -336,6 +722,7 @@ class HTTPClient:
         filters: EducatieFilters | None = None,
         limiet: int | None = 20,
         met_details: bool = False,
+        detail_concurrency: int = 10,
     ) -> list[Organisatie] | list[OrganisationDetail]:
         """Zoek organisaties op basis van locatie en opleiding.
 
@@ -367,41 +754,111 @@ class HTTPClient:
             erkenningen en leerplaatsen. Wanneer `False`, worden alleen basisgegevens
             geretourneerd zoals naam, adres en website.
             Dit is standaard `False`.
+        detail_concurrency: int
+            Maximum aantal detail-aanroepen dat tegelijk uitstaat wanneer `met_details` `True` is.
+            Dit is standaard `10`.
 
         Returns
         -------
         list[Organisatie] | list[OrganisationDetail]
             Lijst van organisaties (basis) of gedetailleerde organisaties.
         """
+        paginator = self.__organisatie_paginator(
+            plaats_postcode=plaats_postcode,
+            crebocode=crebocode,
+            straal=straal,
+            leerweg=leerweg,
+            filters=filters,
+            limiet=limiet,
+        )
+        results: list[OrganizationSearchResultItemPayload] = await paginator.collect()
+
+        if met_details:
+            return await self.__organisatie_details(results, detail_concurrency)
+
+        return [Organisatie(item) for item in results]
+
+    async def itereer_organisaties(
+        self,
+        *,
+        plaats_postcode: str,
+        crebocode: int,
+        straal: Straal = Straal.KM_15,
+        leerweg: Leerweg | None = None,
+        filters: EducatieFilters | None = None,
+        limiet: int | None = 20,
+        met_details: bool = False,
+        detail_concurrency: int = 10,
+    ) -> AsyncIterator[Organisatie]:
+        """Zoek organisaties en geef ze terug zodra hun pagina binnen is.
+
+        Neemt dezelfde parameters als :meth:`zoek_organisaties`, maar bewaart niet
+        alle resultaten in het geheugen.
+
+        Yields
+        ------
+        Organisatie | OrganisationDetail
+            Organisaties (basis) of gedetailleerde organisaties.
+        """
+        paginator = self.__organisatie_paginator(
+            plaats_postcode=plaats_postcode,
+            crebocode=crebocode,
+            straal=straal,
+            leerweg=leerweg,
+            filters=filters,
+            limiet=limiet,
+        )
+        async for page in paginator.pages():
+            if met_details:
+                for organisatie in await self.__organisatie_details(page, detail_concurrency):
+                    yield organisatie
+            else:
+                for item in page:
+                    yield Organisatie(item)
+
+    def __organisatie_paginator(
+        self,
+        *,
+        plaats_postcode: str,
+        crebocode: int,
+        straal: Straal,
+        leerweg: Leerweg | None,
+        filters: EducatieFilters | None,
+        limiet: int | None,
+    ) -> Paginator[OrganizationSearchResultItemPayload, OrganisationSearchResultPayload]:
         base = self.get_base_params(
             plaats_postcode=plaats_postcode,
             straal=straal,
             crebocode=crebocode,
         )
-        params: list[tuple[str, Any]] = list(base.items())
-        if leerweg is not None:
-            params.append(("learningPath", leerweg.value))
-        if filters is not None:
+        params: list[tuple[str, Any]] = [
+            *base.items(),
+            *((("learningPath", leerweg),) if leerweg is not None else ()),
             # Add filter params, excluding potential duplicate learningPath
-            params.extend((k, v) for (k, v) in filters.to_params() if k != "learningPath")
+            *(kv for kv in (filters.to_params() if filters is not None else ()) if kv[0] != "learningPath"),
+        ]
 
         requestor: MinimalCallable[OrganisationSearchResultPayload] = partial(
             self.__get_organisaties,
             params=params,
         )
-        paginator: Paginator[OrganizationSearchResultItemPayload, OrganisationSearchResultPayload] = Paginator(
+        return Paginator(
             requester=requestor,
             limit=limiet,
             items_key="items",
         )
-        results: list[OrganizationSearchResultItemPayload] = await paginator.collect()
-
-        if met_details:
-            # Fetch detailed info for each organization
-            detail_tasks = [self.haal_organisatie_detail(organisatie_id=item["id"]) for item in results]
-            return await asyncio.gather(*detail_tasks)
 
-        return [Organisatie(item) for item in results]
+    async def __organisatie_details(
+        self,
+        items: list[OrganizationSearchResultItemPayload],
+        detail_concurrency: int,
+    ) -> list[OrganisationDetail]:
+        # Fetch detailed info for each organization
+        return await self.__haal_details(
+            items,
+            haal_op=lambda item: self.haal_organisatie_detail(organisatie_id=item["id"]),
+            gelijktijdig=detail_concurrency,
+        )
 
     async def zoek_educaties(
         self,
@@ -415,6 +872,8 @@ class HTTPClient:
         filters: EducatieFilters | None = None,
         limiet: int | None = 20,
         met_details: bool = False,
+        detail_concurrency: int = 10,
+        benodigde_velden: Iterable[str] | None = None,
     ) -> list[Educatie] | list[EducationDetail]:
         """Zoek educaties (leerplaatsen) op basis van locatie en opleiding.
 
@@ -457,12 +916,95 @@ class HTTPClient:
             vaardigheden, kerntaken en media. Wanneer `False`, worden alleen basisgegevens
             geretourneerd zoals titel, organisatie en adres.
             Dit is standaard `False`.
+        detail_concurrency: int
+            Maximum aantal detail-aanroepen dat tegelijk uitstaat wanneer `met_details` `True` is.
+            Dit is standaard `10`.
+        benodigde_velden: Iterable[str] | None
+            Attribuutpaden (bijv. `"adres.plaats"`) die de aanroeper nodig heeft.
+            Staan die allemaal al op de basis-`Educatie`, dan worden de details
+            overgeslagen, ook als `met_details` `True` is.
+            Dit is standaard `None` (details volgen alleen `met_details`).
 
         Returns
         -------
         list[Educatie] | list[EducationDetail]
             Lijst van educaties (basis) of gedetailleerde educaties.
         """
+        paginator = self.__educatie_paginator(
+            niveau=niveau,
+            plaats_postcode=plaats_postcode,
+            crebocode=crebocode,
+            straal=straal,
+            buitenlandse_bedrijven=buitenlandse_bedrijven,
+            educatie_type=educatie_type,
+            filters=filters,
+            limiet=limiet,
+        )
+        results: list[EducatieSearchResultItemPayload] = await paginator.collect()
+
+        if met_details and (benodigde_velden is None or not _alleen_basisvelden(benodigde_velden)):
+            return await self.__educatie_details(results, detail_concurrency)
+
+        return [Educatie(item) for item in results]
+
+    async def itereer_educaties(
+        self,
+        *,
+        niveau: Niveau,
+        plaats_postcode: str,
+        crebocode: int,
+        straal: Straal | int = Straal.KM_15,
+        buitenlandse_bedrijven: bool | None = None,
+        educatie_type: EducatieZoekType | None = None,
+        filters: EducatieFilters | None = None,
+        limiet: int | None = 20,
+        met_details: bool = False,
+        detail_concurrency: int = 10,
+        benodigde_velden: Iterable[str] | None = None,
+    ) -> AsyncIterator[Educatie]:
+        """Zoek educaties en geef ze terug zodra hun pagina binnen is.
+
+        Neemt dezelfde parameters als :meth:`zoek_educaties`, maar bewaart niet
+        alle resultaten in het geheugen.
+
+        Yields
+        ------
+        Educatie | EducationDetail
+            Educaties (basis) of gedetailleerde educaties.
+        """
+        paginator = self.__educatie_paginator(
+            niveau=niveau,
+            plaats_postcode=plaats_postcode,
+            crebocode=crebocode,
+            straal=straal,
+            buitenlandse_bedrijven=buitenlandse_bedrijven,
+            educatie_type=educatie_type,
+            filters=filters,
+            limiet=limiet,
+        )
+        if benodigde_velden is not None and _alleen_basisvelden(benodigde_velden):
+            met_details = False
+
+        async for page in paginator.pages():
+            if met_details:
+                for educatie in await self.__educatie_details(page, detail_concurrency):
+                    yield educatie
+            else:
+                for item in page:
+                    yield Educatie(item)
+
+    def __educatie_paginator(
+        self,
+        *,
+        niveau: Niveau,
+        plaats_postcode: str,
+        crebocode: int,
+        straal: Straal | int,
+        buitenlandse_bedrijven: bool | None,
+        educatie_type: EducatieZoekType | None,
+        filters: EducatieFilters | None,
+        limiet: int | None,
+    ) -> Paginator[EducatieSearchResultItemPayload, EducatieSearchResultPayload]:
         params: dict[str, Any] = self.get_base_params(
             niveau=niveau,
             plaats_postcode=plaats_postcode,
@@ -471,7 +1013,7 @@ class HTTPClient:
         )
         tuple_params: list[tuple[str, Any]] = []
         if educatie_type is not None:
-            params["type"] = educatie_type.value
+            params["type"] = educatie_type
         if buitenlandse_bedrijven is not None:
             params["buitenlandseBedrijven"] = str(buitenlandse_bedrijven).lower()
         if filters:
@@ -483,19 +1025,23 @@ class HTTPClient:
             self.__get_educations,
             params=tuple_params,
         )
-        paginator: Paginator[EducatieSearchResultItemPayload, EducatieSearchResultPayload] = Paginator(
+        return Paginator(
             requester=requestor,
             limit=limiet,
             items_key="items",
         )
-        results: list[EducatieSearchResultItemPayload] = await paginator.collect()
 
-        if met_details:
-            # Fetch detailed info for each education
-            detail_tasks = [self.haal_educatie_detail(leerplaats_id=item["leerplaatsId"]) for item in results]
-            return await asyncio.gather(*detail_tasks)
-
-        return [Educatie(item) for item in results]
+    async def __educatie_details(
+        self,
+        items: list[EducatieSearchResultItemPayload],
+        detail_concurrency: int,
+    ) -> list[EducationDetail]:
+        # Fetch detailed info for each education
+        return await self.__haal_details(
+            items,
+            haal_op=lambda item: self.haal_educatie_detail(leerplaats_id=item["leerplaatsId"]),
+            gelijktijdig=detail_concurrency,
+        )
 
     async def __get_opleiding_suggesties(
         self,
@@ -503,19 +1049,16 @@ class HTTPClient:
         niveau: Niveau,
         term: str | None,
         page_size: int,
+        page: int | None = None,
     ) -> OpleidingSuggestiePayload:
-        session = await self.get_session()
         params: dict[str, Any] = self.get_base_params(niveau=niveau)
         params["pageSize"] = page_size
+        if page is not None:
+            params["page"] = page
         if term is not None:
             params["term"] = term
 
-        async with session.get(
-            self.OPLEIDING_SUGGESTIES_URL,
-            params=params,
-        ) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+        return await self.request(self.OPLEIDING_SUGGESTIES_URL, params=params, policy="long")
 
     async def zoek_opleidingen(
         self,
@@ -548,6 +1091,30 @@ class HTTPClient:
             term=term,
             page_size=limiet,
         )
+
+        body = data.get("body", {}).get("data", {})
+        items = body.get("items", [])
+        total_pages = body.get("totalPages", 0)
+        # De API kan `pageSize` begrenzen; haal de overige pagina's dan tegelijk op
+        if items and len(items) < limiet and total_pages > 1:
+            laatste = min(total_pages, -(-limiet // len(items)))
+            semaphore = asyncio.Semaphore(5)
+
+            async def haal_pagina(page: int) -> OpleidingSuggestiePayload:
+                async with semaphore:
+                    return await self.__get_opleiding_suggesties(
+                        niveau=niveau,
+                        term=term,
+                        page_size=limiet,
+                        page=page,
+                    )
+
+            pages = await asyncio.gather(*(haal_pagina(page) for page in range(2, laatste + 1)))
+            items.extend(
+                itertools.chain.from_iterable(page.get("body", {}).get("data", {}).get("items", []) for page in pages)
+            )
+            del items[limiet:]
+
         return OpleidingSuggestie(data)
 
     async def haal_educatie_detail(
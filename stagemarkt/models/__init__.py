@@ -4,16 +4,22 @@ Deze package bevat eenvoudige, typed wrapper-modellen rond de payloads die door
 de Stagemarkt API endpoints teruggegeven worden.
 """
 
-from .afbeelding import *
-from .educatie import *
-from .education_detail import *
-from .filters import *
-from .kerntaak import *
-from .locatie import *
-from .opleiding import *
-from .organisatie import *
-from .organisation_detail import *
-from .study_location import *
+from .afbeelding import Afbeelding
+from .educatie import Educatie, Kwalificatie, Vergoeding
+from .education_detail import EducationDetail
+from .filters import EducatieFilters
+from .kerntaak import Kerntaak, KerntaakSubtaak
+from .locatie import Locatie, LocatiePlaats, LocatieSuggestie
+from .opleiding import Opleiding, OpleidingSuggestie
+from .organisatie import Organisatie
+from .organisation_detail import (
+    OrganisationDetail,
+    OrganisationDetailEquivalent,
+    OrganisationDetailErkenning,
+    OrganisationDetailKwalificatie,
+    OrganisationDetailPerson,
+)
+from .study_location import StudyLocation
 
 __all__ = (
     "Afbeelding",
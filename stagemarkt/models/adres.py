@@ -29,9 +29,11 @@ class Land:
     __slots__ = ("code", "id", "naam")
 
     def __init__(self, data: AdresLand) -> None:
-        self.code: str = data.get("code", "")
-        self.naam: str = data.get("naam", data.get("name", ""))
-        self.id: str = data.get("id", "")
+        get = data.get
+        self.code: str = get("code", "")
+        # Bij organisaties in zoekresultaten heet het veld "name"
+        self.naam: str = data["naam"] if "naam" in data else get("name", "")
+        self.id: str = get("id", "")
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} code={self.code!r} naam={self.naam!r}>"
@@ -88,8 +90,11 @@ class Adres:
         self.plaats: str = plaats
         self.locatie_plaats: str | None = locatie_plaats
 
-        self.lat: float | None = coordinaten.get("lat") if coordinaten else None
-        self.lon: float | None = coordinaten.get("lon") if coordinaten else None
+        if coordinaten:
+            self.lat: float | None = coordinaten.get("lat")
+            self.lon: float | None = coordinaten.get("lon")
+        else:
+            self.lat = self.lon = None
         self.land: Land | None = Land(land) if land else None
 
     def __repr__(self) -> str:
@@ -113,12 +118,13 @@ class Adres:
             De gemaakte adresinstantie.
         """
 
+        get = data.get
         return cls(
-            straat=data.get("straat", ""),
-            huisnummer=data.get("huisnummer", ""),
-            postcode=data.get("postcode", ""),
-            plaats=data.get("plaats", ""),
-            locatie_plaats=data.get("locatiePlaats"),
-            coordinaten=data.get("coordinaten"),
-            land=data.get("land"),
+            straat=get("straat", ""),
+            huisnummer=get("huisnummer", ""),
+            postcode=get("postcode", ""),
+            plaats=get("plaats", ""),
+            locatie_plaats=get("locatiePlaats"),
+            coordinaten=get("coordinaten"),
+            land=get("land"),
         )
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Self
 import datetime
+from weakref import WeakValueDictionary
 
 from ..enums import Leerweg
+from ..internals._datetime import parse_iso
 from .adres import Adres
 from .afbeelding import Afbeelding
 from .organisatie import Organisatie
@@ -19,28 +21,91 @@ if TYPE_CHECKING:
 
 __all__ = ("Educatie", "Kwalificatie", "Vergoeding")
 
+# Markeert een nog niet berekende waarde; ``None`` is zelf een geldig resultaat
+_UNSET: Any = object()
+# Sneller dan ``Leerweg[naam]``, met dezelfde KeyError voor onbekende namen
+_LEERWEG_OP_NAAM: dict[str, Leerweg] = dict(Leerweg.__members__)
+# Binnen één antwoord komen dezelfde kwalificaties en vergoedingen bij veel leerplaatsen voor;
+# gelijke payloads delen daarom één instantie zolang die ergens gebruikt wordt
+_KWALIFICATIES: WeakValueDictionary[tuple[Any, str], Kwalificatie] = WeakValueDictionary()
+_VERGOEDINGEN: WeakValueDictionary[tuple[str, str], Vergoeding] = WeakValueDictionary()
+
 
 class Kwalificatie:
-    """Representatie van een kwalificatie die bij een leerplaats hoort."""
+    """Representatie van een kwalificatie die bij een leerplaats hoort.
+
+    Gelijke kwalificaties worden tussen leerplaatsen gedeeld en zijn daarom onveranderlijk.
+    """
+
+    __slots__ = ("__weakref__", "crebocode", "niveau_naam")
+    __match_args__ = ("crebocode", "niveau_naam")
 
-    __slots__ = ("crebocode", "niveau_naam")
+    crebocode: int
+    niveau_naam: str
 
     def __init__(self, data: EducatieSearchResultItemKwalificatiePayload) -> None:
-        self.niveau_naam: str = data.get("niveaunaam", "")
-        self.crebocode: int = int(data.get("crebocode", 0))
+        object.__setattr__(self, "niveau_naam", data.get("niveaunaam", ""))
+        object.__setattr__(self, "crebocode", int(data.get("crebocode", 0)))
+
+    @classmethod
+    def _gedeeld(cls, data: EducatieSearchResultItemKwalificatiePayload) -> Self:
+        key = (data.get("crebocode", 0), data.get("niveaunaam", ""))
+        kwalificatie = _KWALIFICATIES.get(key)
+        if kwalificatie is None:
+            kwalificatie = _KWALIFICATIES[key] = cls(data)
+        return kwalificatie  # pyright: ignore[reportReturnType]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        msg = f"{self.__class__.__name__} is onveranderlijk"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> None:
+        msg = f"{self.__class__.__name__} is onveranderlijk"
+        raise AttributeError(msg)
+
+    def __reduce__(self) -> tuple[type[Self], tuple[Any]]:
+        # Via ``__init__`` opnieuw opbouwen; kopiëren en picklen kunnen de slots niet zetten
+        return self.__class__, ({"niveaunaam": self.niveau_naam, "crebocode": self.crebocode},)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} niveau_naam={self.niveau_naam!r} crebocode={self.crebocode}>"
 
 
 class Vergoeding:
-    """Representatie van een vergoeding die bij een leerplaats hoort."""
+    """Representatie van een vergoeding die bij een leerplaats hoort.
 
-    __slots__ = ("id", "omschrijving")
+    Gelijke vergoedingen worden tussen leerplaatsen gedeeld en zijn daarom onveranderlijk.
+    """
+
+    __slots__ = ("__weakref__", "id", "omschrijving")
+    __match_args__ = ("id", "omschrijving")
+
+    id: str
+    omschrijving: str
 
     def __init__(self, data: EducatieSearchResultItemVergoedingPayload) -> None:
-        self.id: str = data.get("id", "")
-        self.omschrijving: str = data.get("omschrijving", "")
+        object.__setattr__(self, "id", data.get("id", ""))
+        object.__setattr__(self, "omschrijving", data.get("omschrijving", ""))
+
+    @classmethod
+    def _gedeeld(cls, data: EducatieSearchResultItemVergoedingPayload) -> Self:
+        key = (data.get("id", ""), data.get("omschrijving", ""))
+        vergoeding = _VERGOEDINGEN.get(key)
+        if vergoeding is None:
+            vergoeding = _VERGOEDINGEN[key] = cls(data)
+        return vergoeding  # pyright: ignore[reportReturnType]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        msg = f"{self.__class__.__name__} is onveranderlijk"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> None:
+        msg = f"{self.__class__.__name__} is onveranderlijk"
+        raise AttributeError(msg)
+
+    def __reduce__(self) -> tuple[type[Self], tuple[Any]]:
+        # Via ``__init__`` opnieuw opbouwen; kopiëren en picklen kunnen de slots niet zetten
+        return self.__class__, ({"id": self.id, "omschrijving": self.omschrijving},)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id!r} omschrijving={self.omschrijving!r}>"
@@ -75,12 +140,19 @@ class Educatie:
 
     __slots__ = (
         "_adres",
+        "_adres_cache",
         "_afbeeldingen",
+        "_afbeeldingen_cache",
         "_gewijzigd_datum",
+        "_gewijzigd_op",
         "_kwalificatie",
+        "_kwalificatie_cache",
         "_organisatie",
+        "_organisatie_cache",
+        "_start_op",
         "_startdatum",
         "_vergoedingen",
+        "_vergoedingen_cache",
         "afstand",
         "bedrag_tot",
         "bedrag_van",
@@ -93,29 +165,39 @@ class Educatie:
     )
 
     def __init__(self, data: EducatieSearchResultItemPayload | EducationDetailPayload) -> None:
-        self.title: str = data.get("titel", "")
-        self.wervende_title: str = data.get("wervendeTitel", "")
-        self.leerplaats_id: str = data.get("leerplaatsId") or data.get("id", "")
-        self.afstand: float | None = data.get("afstand")
-        self.bedrag_van: int = data.get("bedragVan")
-        self.bedrag_tot: int = data.get("bedragTot")
-        self.leerweg: Leerweg = Leerweg[data.get("leerweg", "BOL")]
-        self.kenmerken: list[str] = data.get("kenmerken", [])
+        get = data.get
+        self.title: str = get("titel", "")
+        self.wervende_title: str = get("wervendeTitel", "")
+        self.leerplaats_id: str = get("leerplaatsId") or get("id", "")
+        self.afstand: float | None = get("afstand")
+        self.bedrag_van: int = get("bedragVan")
+        self.bedrag_tot: int = get("bedragTot")
+        self.leerweg: Leerweg = _LEERWEG_OP_NAAM[get("leerweg", "BOL")]
+        self.kenmerken: list[str] = get("kenmerken", [])
 
         try:
-            dagen_per_week = int(data.get("dagenPerWeek", 0))  # pyright: ignore[reportArgumentType]
+            dagen_per_week = int(get("dagenPerWeek", 0))  # pyright: ignore[reportArgumentType]
         except (TypeError, ValueError):
             dagen_per_week = 0
 
         self.dagen_per_week: int = dagen_per_week
 
-        self._kwalificatie = data.get("kwalificatie")
-        self._afbeeldingen = data.get("afbeeldingen", [])
-        self._organisatie = data.get("organisatie")
-        self._adres = data.get("adres")
-        self._vergoedingen = data.get("vergoedingen", [])
-        self._gewijzigd_datum = data.get("gewijzigdDatum")
-        self._startdatum = data.get("startdatum")
+        self._kwalificatie = get("kwalificatie")
+        self._afbeeldingen = get("afbeeldingen", [])
+        self._organisatie = get("organisatie")
+        self._adres = get("adres")
+        self._vergoedingen = get("vergoedingen", [])
+        self._gewijzigd_datum = get("gewijzigdDatum")
+        self._startdatum = get("startdatum")
+        # Worden bij de eerste keer opvragen geparsed
+        self._gewijzigd_op: datetime.datetime | None = _UNSET
+        self._start_op: datetime.datetime | None = _UNSET
+        # Onderliggende modellen worden bij de eerste keer opvragen gemaakt; daarna is de ruwe data niet meer nodig
+        self._adres_cache: Adres | None = _UNSET
+        self._afbeeldingen_cache: list[Afbeelding] = _UNSET
+        self._kwalificatie_cache: Kwalificatie | None = _UNSET
+        self._organisatie_cache: Organisatie | None = _UNSET
+        self._vergoedingen_cache: list[Vergoeding] = _UNSET
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} organisatie={self.organisatie!r}>"
@@ -124,55 +206,58 @@ class Educatie:
     def gewijzigd_op(self) -> datetime.datetime | None:
         """:class:`datetime.datetime`: de datum/tijd waarop de leerplaats voor het laatst is gewijzigd."""
 
-        if self._gewijzigd_datum:
-            # Handle ISO 8601 format with optional milliseconds and 'Z'
-            date_str = self._gewijzigd_datum.rstrip("Z")
-            try:
-                return datetime.datetime.fromisoformat(date_str)
-            except ValueError:
-                # Fallback: parse only the date part
-                return datetime.datetime.fromisoformat(date_str.split("T")[0])
-        return None
+        if self._gewijzigd_op is _UNSET:
+            self._gewijzigd_op = None
+            if self._gewijzigd_datum:
+                self._gewijzigd_op = parse_iso(self._gewijzigd_datum)
+        return self._gewijzigd_op
 
     @property
     def start_op(self) -> datetime.datetime | None:
         """:class:`datetime.datetime`: de startdatum van de leerplaats."""
-        if self._startdatum:
-            date_str = self._startdatum.rstrip("Z")
-            try:
-                return datetime.datetime.fromisoformat(date_str)
-            except ValueError:
-                return datetime.datetime.fromisoformat(date_str.split("T")[0])
-        return None
+        if self._start_op is _UNSET:
+            self._start_op = None
+            if self._startdatum:
+                self._start_op = parse_iso(self._startdatum)
+        return self._start_op
 
     @property
     def adres(self) -> Adres | None:
         """:class:`Adres` | ``None``: het adres van de leerplaats."""
-        if self._adres:
-            return Adres.from_dict(self._adres)  # pyright: ignore[reportArgumentType]
-        return None
+        if self._adres_cache is _UNSET:
+            self._adres_cache = Adres.from_dict(self._adres) if self._adres else None  # pyright: ignore[reportArgumentType]
+            self._adres = None
+        return self._adres_cache
 
     @property
     def vergoedingen(self) -> list[Vergoeding]:
         """list[:class:`Vergoeding`]: lijst met vergoedingen van de leerplaats."""
 
-        return [Vergoeding(vdata) for vdata in self._vergoedingen]
+        if self._vergoedingen_cache is _UNSET:
+            self._vergoedingen_cache = [Vergoeding._gedeeld(vdata) for vdata in self._vergoedingen]
+            self._vergoedingen = []
+        return self._vergoedingen_cache
 
     @property
     def organisatie(self) -> Organisatie | None:
         """:class:`Organisatie` | ``None``: de organisatie die de leerplaats aanbiedt."""
-        if self._organisatie:
-            return Organisatie(self._organisatie)  # pyright: ignore[reportArgumentType]
-        return None
+        if self._organisatie_cache is _UNSET:
+            self._organisatie_cache = Organisatie(self._organisatie) if self._organisatie else None  # pyright: ignore[reportArgumentType]
+            self._organisatie = None
+        return self._organisatie_cache
 
     @property
     def afbeeldingen(self) -> list[Afbeelding]:
         """list[:class:`Afbeelding`]: lijst met afbeeldingen die bij de leerplaats advertentie horen."""
-        return [Afbeelding(adata) for adata in self._afbeeldingen]
+        if self._afbeeldingen_cache is _UNSET:
+            self._afbeeldingen_cache = [Afbeelding(adata) for adata in self._afbeeldingen]
+            self._afbeeldingen = []
+        return self._afbeeldingen_cache
 
     @property
     def kwalificatie(self) -> Kwalificatie | None:
         """:class:`Kwalificatie` | ``None``: de kwalificatie van de leerplaats."""
-        if self._kwalificatie:
-            return Kwalificatie(self._kwalificatie)  # pyright: ignore[reportArgumentType]
-        return None
+        if self._kwalificatie_cache is _UNSET:
+            self._kwalificatie_cache = Kwalificatie._gedeeld(self._kwalificatie) if self._kwalificatie else None  # pyright: ignore[reportArgumentType]
+            self._kwalificatie = None
+        return self._kwalificatie_cache
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from .educatie import Educatie
+from .educatie import _UNSET, Educatie
 from .kerntaak import Kerntaak
 
 if TYPE_CHECKING:
@@ -52,6 +52,7 @@ class EducationDetail(Educatie):
 
     __slots__ = (
         "_kerntaken",
+        "_kerntaken_cache",
         "aanbieden",
         "aantal",
         "contactpersoon",
@@ -66,21 +67,23 @@ class EducationDetail(Educatie):
 
     def __init__(self, data: EducationDetailPayload) -> None:
         super().__init__(data)  # pyright: ignore[reportArgumentType]
+        get = data.get
         # extra fields present on the detail payload
-        self.aantal: int = data.get("aantal", 0)
-        self.contactpersoon: str = data.get("contactpersoon", "")
-        self.emailadres: str = data.get("emailadres", "")
-        self.telefoon: str = data.get("telefoon", "")
+        self.aantal: int = get("aantal", 0)
+        self.contactpersoon: str = get("contactpersoon", "")
+        self.emailadres: str = get("emailadres", "")
+        self.telefoon: str = get("telefoon", "")
         # `Educatie` has `leerplaats_id` and other fields; keep `id` too
-        self.id: str = data.get("id", "")
-        self.omschrijving: str = data.get("omschrijving", "")
-        self.vaardigheden: str = data.get("vaardigheden", "")
-        self.aanbieden: str = data.get("aanbieden", "")
-        self.website: str = data.get("website", "")
+        self.id: str = get("id", "")
+        self.omschrijving: str = get("omschrijving", "")
+        self.vaardigheden: str = get("vaardigheden", "")
+        self.aanbieden: str = get("aanbieden", "")
+        self.website: str = get("website", "")
 
         # kerntaken and media are specific to the detail payload
-        self._kerntaken = data.get("kerntaken", [])
-        self.media: list[str] = data.get("media", [])
+        self._kerntaken = get("kerntaken", [])
+        self._kerntaken_cache: list[Kerntaak] = _UNSET
+        self.media: list[str] = get("media", [])
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id!r} title={self.title!r}>"
@@ -88,4 +91,7 @@ class EducationDetail(Educatie):
     @property
     def kerntaken(self) -> list[Kerntaak]:
         """list[:class:`Kerntaak`]: lijst met kerntaken die bij de leerplaats horen."""
-        return [Kerntaak(k) for k in getattr(self, "_kerntaken", [])]
+        if self._kerntaken_cache is _UNSET:
+            self._kerntaken_cache = [Kerntaak(k) for k in self._kerntaken]
+            self._kerntaken = []
+        return self._kerntaken_cache
@@ -8,8 +8,8 @@ URL.
 from __future__ import annotations
 
 from typing import Any, Self
-from collections.abc import Sequence
-from enum import Enum
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
 from urllib.parse import parse_qs, quote_plus, unquote, urlparse
 
 from ..enums import Leerweg, Sector, SoortBedrijf
@@ -17,6 +17,25 @@ from ..enums import Leerweg, Sector, SoortBedrijf
 __all__ = ("EducatieFilters",)
 
 
+def _voeg_uniek_toe[T](doel: list[T], nieuw: Iterable[T]) -> None:
+    # StrEnum-leden zijn gelijk aan (en hashen als) hun string-waarde, dus een set
+    # vindt dubbelen net zo goed als `in` op de lijst, maar zonder de lijst telkens te doorlopen
+    gezien = set(doel)
+    for item in nieuw:
+        if item not in gezien:
+            gezien.add(item)
+            doel.append(item)
+
+
+# Waarde -> lid, zodat `from_url` onbekende waarden zonder uitzondering kan herkennen
+_SOORT_BEDRIJF_OP_WAARDE: dict[str, SoortBedrijf] = {m.value: m for m in SoortBedrijf}
+_SECTOR_OP_WAARDE: dict[str, Sector] = {m.value: m for m in Sector}
+_LEERWEG_OP_WAARDE: dict[str, Leerweg] = {m.value: m for m in Leerweg}
+
+# Dezelfde trefwoorden worden bij elke pagina en elke zoekopdracht opnieuw gecodeerd
+_quote_trefwoord = lru_cache(maxsize=256)(quote_plus)
+
+
 class EducatieFilters:
     """Filters voor het zoeken naar leerplaatsen.
 
@@ -46,11 +65,12 @@ class EducatieFilters:
         self.leerwegen: list[Leerweg | str] = leerwegen or []
 
         if trefwoorden is None:
-            self.trefwoorden: list[str] = []
+            lijst: list[str] = []
         elif isinstance(trefwoorden, str):
-            self.trefwoorden: list[str] = [trefwoorden]
+            lijst = [trefwoorden]
         else:
-            self.trefwoorden: list[str] = list(trefwoorden)
+            lijst = list(trefwoorden)
+        self.trefwoorden: list[str] = lijst
 
     def merge(self, other: EducatieFilters) -> None:
         """Voeg ontbrekende filterwaarden toe vanuit een andere instantie.
@@ -61,10 +81,10 @@ class EducatieFilters:
             Filters die gemerged worden in de huidige instantie.
         """
 
-        self.bedrijf_soorten.extend(bs for bs in other.bedrijf_soorten if bs not in self.bedrijf_soorten)
-        self.sectoren.extend(s for s in other.sectoren if s not in self.sectoren)
-        self.leerwegen.extend(lw for lw in other.leerwegen if lw not in self.leerwegen)
-        self.trefwoorden.extend(kw for kw in other.trefwoorden if kw not in self.trefwoorden)
+        _voeg_uniek_toe(self.bedrijf_soorten, other.bedrijf_soorten)
+        _voeg_uniek_toe(self.sectoren, other.sectoren)
+        _voeg_uniek_toe(self.leerwegen, other.leerwegen)
+        _voeg_uniek_toe(self.trefwoorden, other.trefwoorden)
 
     def voeg_bedrijf_soort_toe(self, soort: SoortBedrijf | str) -> None:
         """Voeg een bedrijfstype toe als deze nog niet aanwezig is."""
@@ -108,21 +128,14 @@ class EducatieFilters:
         parsed = urlparse(url)
         params = parse_qs(parsed.query)
 
-        bedrijf_soorten: Sequence[SoortBedrijf | str] = params.get("companyType", [])
-        sectoren: Sequence[Sector | str] = params.get("sector", [])
-        leerwegen: Sequence[Leerweg | str] = params.get("learningPath", [])
+        # parse_qs decodeert de waarden al; alleen trefwoorden zijn door `to_params` vooraf
+        # met quote_plus gecodeerd en moeten nog een keer gedecodeerd worden
         trefwoorden: list[str] = [unquote(k) for k in params.get("keyword", [])]
 
-        # Try to convert to enum if possible, otherwise keep as string
-        def try_enum[EnumT: Enum](enum_cls: type[EnumT], value: str) -> EnumT | str:
-            try:
-                return enum_cls(value)
-            except Exception:  # noqa: BLE001
-                return value
-
-        bedrijf_soorten = [try_enum(SoortBedrijf, unquote(b)) for b in bedrijf_soorten]
-        sectoren = [try_enum(Sector, unquote(s)) for s in sectoren]
-        leerwegen = [try_enum(Leerweg, unquote(le)) for le in leerwegen]
+        # Convert to enum if possible, otherwise keep as string
+        bedrijf_soorten = [_SOORT_BEDRIJF_OP_WAARDE.get(b, b) for b in params.get("companyType", [])]
+        sectoren = [_SECTOR_OP_WAARDE.get(s, s) for s in params.get("sector", [])]
+        leerwegen = [_LEERWEG_OP_WAARDE.get(le, le) for le in params.get("learningPath", [])]
 
         return cls(
             bedrijf_soorten=bedrijf_soorten,
@@ -141,16 +154,13 @@ class EducatieFilters:
             HTTP client.
         """
 
-        params: list[tuple[str, Any]] = []
-        if self.bedrijf_soorten:
-            params.extend(("companyType", bs.value if isinstance(bs, SoortBedrijf) else bs) for bs in self.bedrijf_soorten)
-        if self.sectoren:
-            params.extend(("sector", s.value if isinstance(s, Sector) else s) for s in self.sectoren)
-        if self.leerwegen:
-            params.extend(("learningPath", lw.value if isinstance(lw, Leerweg) else lw) for lw in self.leerwegen)
+        # StrEnum: str() geeft de waarde, zonder isinstance-controle per item
+        params: list[tuple[str, Any]] = [("companyType", str(bs)) for bs in self.bedrijf_soorten]
+        params += [("sector", str(s)) for s in self.sectoren]
+        params += [("learningPath", str(lw)) for lw in self.leerwegen]
         if self.trefwoorden:
             params.append(
-                ("keyword", "+".join(quote_plus(kw) for kw in self.trefwoorden))
+                ("keyword", "+".join([_quote_trefwoord(kw) for kw in self.trefwoorden]))
                 if not isinstance(self.trefwoorden, str)
                 else ("keyword", self.trefwoorden),
             )
@@ -34,6 +34,7 @@ class KerntaakSubtaak:
     """
 
     __slots__ = ("code", "id", "naam", "uitvoerbaar")
+    __match_args__ = __slots__
 
     def __init__(
         self,
@@ -68,6 +69,7 @@ class Kerntaak:
     """
 
     __slots__ = ("_subtaken", "aantal_subtaken", "aantal_uitvoerbaar", "code", "id", "naam")
+    __match_args__ = ("aantal_subtaken", "aantal_uitvoerbaar", "code", "id", "naam")
 
     def __init__(
         self,
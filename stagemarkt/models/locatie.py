@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
 
 from ..enums import LocatieType
 
@@ -15,6 +16,10 @@ if TYPE_CHECKING:
 
 __all__ = ("Locatie", "LocatiePlaats", "LocatieSuggestie")
 
+_LOCATIE_TYPE_OP_WAARDE: dict[str, LocatieType] = {m.value: m for m in LocatieType}
+# Gedeelde, alleen-lezen terugval voor ontbrekende onderdelen van een antwoord
+_EMPTY: Any = MappingProxyType({})
+
 
 class LocatiePlaats:
     """Representatie van een plaats binnen een locatie-suggestie uit de Stagemarkt API.
@@ -38,6 +43,7 @@ class LocatiePlaats:
     """
 
     __slots__ = ("gemeente", "lat", "lon", "naam", "postcode", "provincie", "regio")
+    __match_args__ = __slots__
 
     def __init__(self, data: LocatieSuggestieBodyDataItemPlaatsPayload) -> None:
         self.gemeente: str | None = data.get("gemeente")
@@ -66,10 +72,12 @@ class Locatie:
     """
 
     __slots__ = ("plaats", "suggestie", "type")
+    __match_args__ = __slots__
 
     def __init__(self, data: LocatieSuggestieBodyDataItemPayload) -> None:
         self.suggestie: str | None = data.get("suggestie")
-        self.type: LocatieType | None = LocatieType(ltype) if (ltype := data.get("type")) else None
+        # Een ontbrekend of onbekend type wordt None
+        self.type: LocatieType | None = _LOCATIE_TYPE_OP_WAARDE.get(data.get("type"))  # pyright: ignore[reportArgumentType]
 
         self.plaats: LocatiePlaats | None = LocatiePlaats(plaatsdata) if (plaatsdata := data.get("plaats")) else None
 
@@ -83,13 +91,13 @@ class LocatieSuggestie:
     Zie :attr:`locaties` voor de lijst met locatie-suggesties.
     """
 
-    __slots__ = ("_locaties",)
+    __slots__ = ("_locaties", "_locaties_data")
 
     def __init__(self, data: LocatieSuggestiePayload) -> None:
-        body = data.get("body", {})
-        items = body.get("data", {})
-
-        self._locaties = [Locatie(item) for item in items]
+        body = data.get("body") or _EMPTY
+        # De modellen worden pas gemaakt wanneer `locaties` wordt opgevraagd
+        self._locaties_data = body.get("data") or ()
+        self._locaties: list[Locatie] | None = None
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} locaties={self.locaties!r}>"
@@ -97,4 +105,7 @@ class LocatieSuggestie:
     @property
     def locaties(self) -> list[Locatie]:
         """list[:class:`Locatie`]: lijst met locatie-suggesties."""
+        if self._locaties is None:
+            self._locaties = [Locatie(item) for item in self._locaties_data]
+            self._locaties_data = ()
         return self._locaties
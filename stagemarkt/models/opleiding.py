@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
 
 if TYPE_CHECKING:
     from internals._types.opleiding_suggestions import (
@@ -13,6 +14,9 @@ if TYPE_CHECKING:
 
 __all__ = ("Opleiding", "OpleidingSuggestie")
 
+# Gedeelde, alleen-lezen terugval voor ontbrekende onderdelen van een antwoord
+_EMPTY: Any = MappingProxyType({})
+
 
 class Opleiding:
     """Opleiding-item uit een suggestieresultaat.
@@ -32,6 +36,7 @@ class Opleiding:
     """
 
     __slots__ = ("crebo_code", "equivalenten", "label", "synoniemen", "value")
+    __match_args__ = __slots__
 
     def __init__(self, data: OpleidingSuggestieBodyDataItemPayload) -> None:
         self.crebo_code: int | None = data.get("creboCode")
@@ -52,6 +57,7 @@ class OpleidingSuggestie:
 
     __slots__ = (
         "_opleidingen",
+        "_opleidingen_data",
         "has_next_page",
         "has_previous_page",
         "page_number",
@@ -60,7 +66,8 @@ class OpleidingSuggestie:
     )
 
     def __init__(self, data: OpleidingSuggestiePayload) -> None:
-        body_data = data.get("body", {}).get("data", {})
+        body = data.get("body") or _EMPTY
+        body_data = body.get("data") or _EMPTY
 
         self.has_next_page: bool = body_data.get("hasNextPage", False)
         self.has_previous_page: bool = body_data.get("hasPreviousPage", False)
@@ -68,8 +75,9 @@ class OpleidingSuggestie:
         self.total_count: int = body_data.get("totalCount", 0)
         self.total_pages: int = body_data.get("totalPages", 0)
 
-        items = body_data.get("items", [])
-        self._opleidingen = [Opleiding(item) for item in items]
+        # De modellen worden pas gemaakt wanneer `opleidingen` wordt opgevraagd
+        self._opleidingen_data = body_data.get("items") or ()
+        self._opleidingen: list[Opleiding] | None = None
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} total_count={self.total_count} page_number={self.page_number}>"
@@ -77,4 +85,7 @@ class OpleidingSuggestie:
     @property
     def opleidingen(self) -> list[Opleiding]:
         """list[:class:`Opleiding`]: lijst met opleiding-suggesties."""
+        if self._opleidingen is None:
+            self._opleidingen = [Opleiding(item) for item in self._opleidingen_data]
+            self._opleidingen_data = ()
         return self._opleidingen
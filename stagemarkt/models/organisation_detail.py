@@ -8,8 +8,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 import datetime
+from functools import lru_cache
+import sys
 
 from ..enums import Niveau
+from ..internals._datetime import parse_iso
+from .educatie import _UNSET
 from .kerntaak import Kerntaak
 from .organisatie import Organisatie
 
@@ -32,6 +36,24 @@ __all__ = (
 )
 
 
+def _intern(value: str | None) -> str | None:
+    # Voor velden met weinig verschillende waarden, zodat gelijke strings één object delen
+    return sys.intern(value) if value is not None else None
+
+
+# Ook de terugval wordt per string onthouden, zodat een datum die niet direct te parsen
+# is niet voor elke rij opnieuw een uitzondering oplevert
+@lru_cache(maxsize=1024)
+def _parse_datum(value: str | None) -> datetime.datetime | None:
+    if not value:
+        return None
+    try:
+        return parse_iso(value)
+    except ValueError:
+        # Alleen het datumdeel gebruiken als de tijd niet te parsen is
+        return parse_iso(value.removesuffix("Z").split("T")[0])
+
+
 class OrganisationDetailEquivalent:
     """Representatie van een equivalente kwalificatie in de organisatie.
 
@@ -75,8 +97,12 @@ class OrganisationDetailKwalificatie:
 
     __slots__ = (
         "_einddatum",
+        "_eindigd_op",
         "_equivalenten",
+        "_equivalenten_cache",
         "_kerntaken",
+        "_kerntaken_cache",
+        "_start_op",
         "_startdatum",
         "crebocode",
         "kwalificatie",
@@ -89,13 +115,20 @@ class OrganisationDetailKwalificatie:
         self.crebocode: str = data.get("crebocode", "")
         self.kwalificatie: str = data.get("kwalificatie", "")
         self.niveau: Niveau | None = Niveau(niveau) if (niveau := data.get("niveau")) else None
-        self.sector: str | None = data.get("sector")
-        self.sector_id: str | None = data.get("sectorId")
+        # Veel kwalificaties delen dezelfde sector
+        self.sector: str | None = _intern(data.get("sector"))
+        self.sector_id: str | None = _intern(data.get("sectorId"))
 
         self._startdatum: str | None = data.get("startdatum")
         self._einddatum: str | None = data.get("einddatum")
+        # Worden bij de eerste keer opvragen geparsed
+        self._start_op: datetime.datetime | None = _UNSET
+        self._eindigd_op: datetime.datetime | None = _UNSET
         self._equivalenten = data.get("equivalenten", [])
         self._kerntaken = data.get("kerntaken", [])
+        # Onderliggende modellen worden bij de eerste keer opvragen gemaakt; daarna is de ruwe data niet meer nodig
+        self._equivalenten_cache: list[OrganisationDetailEquivalent] = _UNSET
+        self._kerntaken_cache: list[Kerntaak] = _UNSET
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} crebocode={self.crebocode!r} kwalificatie={self.kwalificatie!r}>"
@@ -104,46 +137,48 @@ class OrganisationDetailKwalificatie:
     def equivalenten(self) -> list[OrganisationDetailEquivalent]:
         """Lijst met equivalente kwalificaties."""
 
-        return [OrganisationDetailEquivalent(e) for e in self._equivalenten]
+        if self._equivalenten_cache is _UNSET:
+            self._equivalenten_cache = [OrganisationDetailEquivalent(e) for e in self._equivalenten]
+            self._equivalenten = []
+        return self._equivalenten_cache
 
     @property
     def kerntaken(self) -> list[Kerntaak]:
         """Kerntaken gekoppeld aan deze kwalificatie."""
 
-        return [Kerntaak(k) for k in self._kerntaken]
+        if self._kerntaken_cache is _UNSET:
+            self._kerntaken_cache = [Kerntaak(k) for k in self._kerntaken]
+            self._kerntaken = []
+        return self._kerntaken_cache
 
     @property
     def start_op(self) -> datetime.datetime | None:
         """:class:`datetime.datetime`: de startdatum van de leerplaats."""
-        if self._startdatum:
-            date_str = self._startdatum.rstrip("Z")
-            try:
-                return datetime.datetime.fromisoformat(date_str)
-            except ValueError:
-                return datetime.datetime.fromisoformat(date_str.split("T")[0])
-        return None
+        if self._start_op is _UNSET:
+            self._start_op = _parse_datum(self._startdatum)
+        return self._start_op
 
     @property
     def eindigd_op(self) -> datetime.datetime | None:
         """:class:`datetime.datetime`: de einddatum van de leerplaats."""
-        if self._startdatum:
-            date_str = self._startdatum.rstrip("Z")
-            try:
-                return datetime.datetime.fromisoformat(date_str)
-            except ValueError:
-                return datetime.datetime.fromisoformat(date_str.split("T")[0])
-        return None
+        if self._eindigd_op is _UNSET:
+            self._eindigd_op = _parse_datum(self._einddatum)
+        return self._eindigd_op
 
 
 class OrganisationDetailErkenning:
     """Representatie van een erkenning van een organisatie."""
 
-    __slots__ = ("_einddatum", "_kwalificaties", "_startdatum")
+    __slots__ = ("_einddatum", "_eindigd_op", "_kwalificaties", "_kwalificaties_cache", "_start_op", "_startdatum")
 
     def __init__(self, data: ErkenningPayload) -> None:
         self._startdatum: str | None = data.get("startdatum")
         self._einddatum: str | None = data.get("einddatum")
+        # Worden bij de eerste keer opvragen geparsed
+        self._start_op: datetime.datetime | None = _UNSET
+        self._eindigd_op: datetime.datetime | None = _UNSET
         self._kwalificaties = data.get("kwalificaties", [])
+        self._kwalificaties_cache: list[OrganisationDetailKwalificatie] = _UNSET
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} start_op={self.start_op!r} eindigd_op={self.eindigd_op!r}>"
@@ -152,29 +187,24 @@ class OrganisationDetailErkenning:
     def kwalificaties(self) -> list[OrganisationDetailKwalificatie]:
         """Kwalificaties binnen deze erkenning."""
 
-        return [OrganisationDetailKwalificatie(k) for k in self._kwalificaties]
+        if self._kwalificaties_cache is _UNSET:
+            self._kwalificaties_cache = [OrganisationDetailKwalificatie(k) for k in self._kwalificaties]
+            self._kwalificaties = []
+        return self._kwalificaties_cache
 
     @property
     def start_op(self) -> datetime.datetime | None:
         """:class:`datetime.datetime`: de startdatum van de leerplaats."""
-        if self._startdatum:
-            date_str = self._startdatum.rstrip("Z")
-            try:
-                return datetime.datetime.fromisoformat(date_str)
-            except ValueError:
-                return datetime.datetime.fromisoformat(date_str.split("T")[0])
-        return None
+        if self._start_op is _UNSET:
+            self._start_op = _parse_datum(self._startdatum)
+        return self._start_op
 
     @property
     def eindigd_op(self) -> datetime.datetime | None:
         """:class:`datetime.datetime`: de einddatum van de leerplaats."""
-        if self._startdatum:
-            date_str = self._startdatum.rstrip("Z")
-            try:
-                return datetime.datetime.fromisoformat(date_str)
-            except ValueError:
-                return datetime.datetime.fromisoformat(date_str.split("T")[0])
-        return None
+        if self._eindigd_op is _UNSET:
+            self._eindigd_op = _parse_datum(self._einddatum)
+        return self._eindigd_op
 
 
 class OrganisationDetailPerson:
@@ -205,7 +235,7 @@ class OrganisationDetailPerson:
         self.voornaam: str | None = data.get("firstName")
         self.achternaam: str | None = data.get("lastName")
         self.initialen: str | None = data.get("initials")
-        self.voorvoegsel: str | None = data.get("insertion")
+        self.voorvoegsel: str | None = _intern(data.get("insertion"))
         self.mobiel: str | None = data.get("mobile")
         self.telefoonnummer: str | None = data.get("phone")
 
@@ -233,8 +263,9 @@ class OrganisationDetail(Organisatie):
 
     __slots__ = (
         "_erkenning",
-        "_leerplaatsen",
+        "_erkenning_cache",
         "_personen",
+        "_personen_cache",
         "informatie_leren_werken",
         "informatie_student",
         "telefoonnummer",
@@ -248,8 +279,10 @@ class OrganisationDetail(Organisatie):
         self.informatie_student: str | None = data.get("informatieStudent")
 
         self._personen = data.get("personen", [])
-        self._leerplaatsen = data.get("leerplaatsen", [])
         self._erkenning = data.get("erkenning")
+        # Onderliggende modellen worden bij de eerste keer opvragen gemaakt; daarna is de ruwe data niet meer nodig
+        self._personen_cache: list[OrganisationDetailPerson] = _UNSET
+        self._erkenning_cache: OrganisationDetailErkenning | None = _UNSET
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} naam={self.naam!r} id={self.id!r}>"
@@ -257,11 +290,15 @@ class OrganisationDetail(Organisatie):
     @property
     def personen(self) -> list[OrganisationDetailPerson]:
         """list[:class:`OrganisationDetailPerson`]: lijst met contactpersonen van de organisatie."""
-        return [OrganisationDetailPerson(p) for p in self._personen]
+        if self._personen_cache is _UNSET:
+            self._personen_cache = [OrganisationDetailPerson(p) for p in self._personen]
+            self._personen = []
+        return self._personen_cache
 
     @property
     def erkenning(self) -> OrganisationDetailErkenning | None:
         """OrganisationDetailErkenning | None: erkenninginformatie van de organisatie, indien aanwezig."""
-        if self._erkenning:
-            return OrganisationDetailErkenning(self._erkenning)
-        return None
+        if self._erkenning_cache is _UNSET:
+            self._erkenning_cache = OrganisationDetailErkenning(self._erkenning) if self._erkenning else None
+            self._erkenning = None
+        return self._erkenning_cache
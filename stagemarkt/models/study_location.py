@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+import sys
 
 from .adres import Adres
 
@@ -46,7 +47,9 @@ class StudyLocation:
 
     def __init__(self, data: StudyLocationResultPayload) -> None:
         self.location_naam: str = data.get("locationName", "")
-        self.school_naam: str = data.get("schoolName", "")
+        # Meerdere locaties van dezelfde school delen de schoolnaam
+        school_naam = data.get("schoolName", "")
+        self.school_naam: str = sys.intern(school_naam) if school_naam is not None else school_naam
         self.emailadres: str = data.get("emailadres", "")
         self.telefoonnummer: str = data.get("telefoonnummer", "")
         self.website: str = data.get("website", "")
@@ -0,0 +1,41 @@
+"""Hulpmiddelen voor het draaien van async code.
+
+``uvloop`` is een optionele afhankelijkheid (``pip install stagemarkt-api[speed]``)
+en is niet beschikbaar op Windows; zonder ``uvloop`` wordt de standaard event loop
+gebruikt.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+__all__ = ("run",)
+
+
+def run[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Draai een coroutine tot deze klaar is, met ``uvloop`` wanneer beschikbaar.
+
+    Vervanger voor :func:`asyncio.run`.
+
+    Parameters
+    ----------
+    coro: Coroutine[Any, Any, T]
+        De coroutine om uit te voeren, bijv. ``main()``.
+
+    Returns
+    -------
+    T
+        Het resultaat van de coroutine.
+    """
+
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    return asyncio.run(coro, loop_factory=loop_factory)
@@ -1,13 +1,16 @@
-from .base_exporter import AttrField
-from .excel_exporter import ExcelExporter, to_excel
+from .base_exporter import AttrField, attr_paths
+from .excel_exporter import ExcelExporter, to_excel, to_excel_async
 from .json_exporter import JSONExporter, to_json
-from .stagemarkt import maak_stagemarkt_link
+from .stagemarkt import maak_stagemarkt_link, maak_stagemarkt_link_factory
 
 __all__ = (
     "AttrField",
     "ExcelExporter",
     "JSONExporter",
+    "attr_paths",
     "maak_stagemarkt_link",
+    "maak_stagemarkt_link_factory",
     "to_excel",
+    "to_excel_async",
     "to_json",
 )
@@ -0,0 +1,228 @@
+"""Minimal streaming .xlsx writer.
+
+Writes the worksheet XML straight into the zip archive, one row at a time,
+without going through a spreadsheet library. Only what the Excel exporter
+needs is supported: a single sheet, inline strings, numbers, booleans,
+datetimes, a bold header row, a merged title row and frozen panes.
+"""
+
+from __future__ import annotations
+
+from typing import IO, Any
+from collections.abc import Sequence
+import datetime
+import math
+from pathlib import Path
+import re
+from xml.sax.saxutils import escape, quoteattr
+import zipfile
+
+__all__ = ("FastXlsxWriter",)
+
+# Excel cells hold at most 32767 characters, see xlsxwriter's `write_string`
+_MAX_STRING_LENGTH = 32767
+# Naive on purpose, like the values written to the sheet
+_EXCEL_EPOCH = datetime.datetime.combine(datetime.date(1899, 12, 30), datetime.time())
+_ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# Style indices in `_STYLES`
+_STYLE_HEADER = 1
+_STYLE_TITLE = 2
+_STYLE_DATE = 3
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    "</Relationships>"
+)
+
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name={name} sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy\\-mm\\-dd\\ hh:mm:ss"/></numFmts>'
+    '<fonts count="2">'
+    '<font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font>'
+    "</fonts>"
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="4">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1" applyAlignment="1">'
+    '<alignment horizontal="center"/></xf>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+
+
+def _column_name(index: int) -> str:
+    name = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = chr(65 + remainder) + name
+    return name
+
+
+class FastXlsxWriter:
+    """
+    Stream rows into a single-sheet .xlsx file.
+
+    The title and header rows must be written before any data row; the
+    frozen panes are placed below them.
+
+    Parameters
+    ----------
+    path: Path
+        Output file path.
+    columns: int
+        Number of columns, used for cell references and the merged title.
+    sheet_name: str
+        Name of the worksheet. Default is "Sheet1".
+    title: str | None
+        Optional title written in a merged first row.
+    headers: Sequence[str] | None
+        Optional bold header row.
+    """
+
+    __slots__ = ("_columns", "_merge", "_row", "_sheet", "_zip")
+
+    def __init__(
+        self,
+        path: Path,
+        columns: int,
+        *,
+        sheet_name: str = "Sheet1",
+        title: str | None = None,
+        headers: Sequence[str] | None = None,
+    ) -> None:
+        self._columns: list[str] = [_column_name(i) for i in range(max(columns, 1))]
+        self._merge: str | None = None
+        self._row: int = 0
+
+        self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+        self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", _ROOT_RELS)
+        self._zip.writestr("xl/workbook.xml", _WORKBOOK.format(name=quoteattr(sheet_name)))
+        self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        self._zip.writestr("xl/styles.xml", _STYLES)
+
+        frozen = int(bool(title)) + int(bool(headers))
+        self._sheet: IO[bytes] = self._zip.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self._sheet.write(
+            b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        )
+        if frozen:
+            self._sheet.write(
+                f'<sheetViews><sheetView workbookViewId="0"><pane ySplit="{frozen}" topLeftCell="A{frozen + 1}" '
+                f'activePane="bottomLeft" state="frozen"/></sheetView></sheetViews><sheetData>'.encode()
+            )
+        else:
+            self._sheet.write(b"<sheetData>")
+
+        if title:
+            if columns > 1:
+                self._merge = f"A1:{self._columns[columns - 1]}1"
+            self._write_cells([title], style=_STYLE_TITLE)
+        if headers:
+            self._write_cells(headers, style=_STYLE_HEADER)
+
+    def write_row(self, values: Sequence[Any]) -> None:
+        """
+        Write one data row.
+
+        Parameters
+        ----------
+        values: Sequence[Any]
+            Cell values. `None` and empty strings leave the cell blank.
+        """
+        self._write_cells(values, style=0)
+
+    def close(self) -> None:
+        """Finish the worksheet and close the archive."""
+
+        if self._zip.fp is None:
+            return
+
+        tail = "</sheetData>"
+        if self._merge is not None:
+            tail += f'<mergeCells count="1"><mergeCell ref="{self._merge}"/></mergeCells>'
+        tail += "</worksheet>"
+        self._sheet.write(tail.encode())
+        self._sheet.close()
+        self._zip.close()
+
+    def _write_cells(self, values: Sequence[Any], *, style: int) -> None:
+        self._row += 1
+        row = self._row
+        columns = self._columns
+        style_attr = f' s="{style}"' if style else ""
+
+        parts = [f'<row r="{row}">']
+        for col, val in enumerate(values):
+            # Like xlsxwriter, empty strings become blank cells
+            if val is None or (isinstance(val, str) and not val):
+                continue
+            ref = f"{columns[col] if col < len(columns) else _column_name(col)}{row}"
+
+            if isinstance(val, bool):
+                parts.append(f'<c r="{ref}"{style_attr} t="b"><v>{int(val)}</v></c>')
+            elif isinstance(val, int):
+                # `int()` so int subclasses such as IntEnum members still write a plain number
+                parts.append(f'<c r="{ref}"{style_attr}><v>{int(val)}</v></c>')
+            elif isinstance(val, float) and math.isfinite(val):
+                parts.append(f'<c r="{ref}"{style_attr}><v>{float(val)!r}</v></c>')
+            elif isinstance(val, datetime.date):
+                moment = val if isinstance(val, datetime.datetime) else datetime.datetime.combine(val, datetime.time())
+                serial = (moment.replace(tzinfo=None) - _EXCEL_EPOCH) / datetime.timedelta(days=1)
+                parts.append(f'<c r="{ref}" s="{_STYLE_DATE}"><v>{serial!r}</v></c>')
+            else:
+                text = _ILLEGAL_XML_CHARS.sub("", str(val))[:_MAX_STRING_LENGTH]
+                parts.append(
+                    f'<c r="{ref}"{style_attr} t="inlineStr"><is><t xml:space="preserve">{escape(text)}</t></is></c>'
+                )
+        parts.append("</row>")
+        self._sheet.write("".join(parts).encode())
@@ -5,7 +5,9 @@ import base64
 from collections.abc import Callable, Sequence
 import datetime
 from enum import Enum
+from functools import cache, lru_cache
 from itertools import chain
+from operator import attrgetter
 
 __all__ = (
     "AttrField",
@@ -13,6 +15,7 @@ __all__ = (
     "BaseExporter",
     "FallbackChain",
     "NormalizedAttr",
+    "attr_paths",
 )
 
 
@@ -190,10 +193,19 @@ AttrSpec = str | tuple[str, str | Sequence[str] | Sequence[tuple[int, str]]] | A
 NormalizedAttr = tuple[str, list[tuple[int, str]] | Callable[[Any], Any] | FallbackChain]
 
 
+_FALSY_IS_EMPTY: Final[frozenset[type]] = frozenset(
+    {type(None), bool, int, float, str, list, dict, tuple, set, frozenset},
+)
+
+
+@cache
 def _get_all_slots(cls: type) -> frozenset[str]:
     """
     Collect all `__slots__` entries from a class hierarchy.
 
+    The result is cached per class for the whole process, since a class's
+    slots never change after it is created.
+
     Parameters
     ----------
     cls: type
@@ -209,6 +221,41 @@ def _get_all_slots(cls: type) -> frozenset[str]:
     return frozenset(chain.from_iterable(slot_iterables))
 
 
+@lru_cache(maxsize=4096, typed=True)
+def _isoformat(value: datetime.datetime | datetime.date | datetime.time) -> str:
+    # The same dates repeat across many rows of an export
+    return value.isoformat()
+
+
+@cache
+def _compile_path(path: str) -> Callable[[Any], Any]:
+    """
+    Compile a (possibly dotted) attribute path into a resolver function.
+
+    The path is turned into an `operator.attrgetter` once, so resolving it for
+    every row does not have to split the path and walk it in Python.
+
+    Parameters
+    ----------
+    path: str
+        Dotted attribute path, e.g. "organisatie.email".
+
+    Returns
+    -------
+    Callable[[Any], Any]
+        A function returning the resolved value, or None if any part is missing.
+    """
+    getter = attrgetter(path)
+
+    def resolve(obj: Any) -> Any:
+        try:
+            return getter(obj)
+        except AttributeError:
+            return None
+
+    return resolve
+
+
 class BaseExporter:
     """
     Base class with shared helpers for exporter implementations.
@@ -219,7 +266,7 @@ class BaseExporter:
     to various file formats (such as Excel or JSON).
     """
 
-    __slots__ = ("_include_empty", "_slots_cache")
+    __slots__ = ("_include_empty",)
 
     _PRIMITIVES: Final[tuple[type, ...]] = (str, int, float, bool, type(None))
     _DATETIME_TYPES: Final[tuple[type, ...]] = (
@@ -240,11 +287,10 @@ class BaseExporter:
             containers) in the export output. Defaults to True.
         """
         self._include_empty = include_empty
-        self._slots_cache: dict[type, frozenset[str]] = {}
 
     def _get_slots_cached(self, cls: type) -> frozenset[str]:
         """
-        Get all __slots__ entries for a class, using a cache for efficiency.
+        Get all __slots__ entries for a class, using the process-wide cache.
 
         Parameters
         ----------
@@ -256,9 +302,7 @@ class BaseExporter:
         frozenset[str]
             The set of slot names for the class.
         """
-        if cls not in self._slots_cache:
-            self._slots_cache[cls] = _get_all_slots(cls)
-        return self._slots_cache[cls]
+        return _get_all_slots(cls)
 
     def _should_include(self, value: Any) -> bool:
         """
@@ -293,8 +337,10 @@ class BaseExporter:
         bool
             True if the value is empty, False otherwise.
         """
-        if value is None or value is False:
-            return True
+        # For these exact types "empty" is the same as falsy, so one set lookup
+        # replaces the isinstance checks for nearly every exported value
+        if type(value) in _FALSY_IS_EMPTY:
+            return not value
         if isinstance(value, (str, list, dict, tuple, set, frozenset)):
             return len(value) == 0
         return bool(isinstance(value, (int, float)) and value == 0)
@@ -319,18 +365,7 @@ class BaseExporter:
         Any
             The resolved value, or None if any part is missing.
         """
-        if "." in attr:
-            parts = attr.split(".")
-            current = obj
-            for part in parts:
-                if current is None:
-                    return None
-                try:
-                    current = getattr(current, part)
-                except AttributeError:
-                    return None
-            return current
-        return getattr(obj, attr, None)
+        return _compile_path(attr)(obj)
 
     @staticmethod
     def _get_attr_key(path: str) -> str:
@@ -430,6 +465,9 @@ class BaseExporter:
         str
             The ISO 8601 string representation.
         """
+        # Equal aware values can differ in offset, so only naive values share cached strings
+        if getattr(obj, "tzinfo", None) is None:
+            return _isoformat(obj)
         return obj.isoformat()
 
     def _convert_timedelta(self, obj: datetime.timedelta) -> float:
@@ -467,3 +505,30 @@ class BaseExporter:
             return obj.decode("utf-8")
         except UnicodeDecodeError:
             return base64.b64encode(obj).decode("ascii")
+
+
+def attr_paths(attrs: Sequence[AttrSpec]) -> set[str]:
+    """
+    Collect the dotted attribute paths used by attribute specifications.
+
+    Useful to tell the client which fields an export needs, e.g.
+    `zoek_stages(..., benodigde_velden=attr_paths(attrs))`. Transformers are
+    opaque, so attributes they read must be added by the caller.
+
+    Parameters
+    ----------
+    attrs: Sequence[AttrSpec]
+        The attribute specifications, as passed to the exporters.
+
+    Returns
+    -------
+    set[str]
+        All attribute paths, including fallback paths.
+    """
+    paths: set[str] = set()
+    for _, spec in BaseExporter._normalize_attrs(attrs):
+        if isinstance(spec, FallbackChain):
+            paths.update(path for _, path in spec.paths)
+        elif not callable(spec):
+            paths.update(path for _, path in spec)
+    return paths
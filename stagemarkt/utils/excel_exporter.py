@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
-from collections.abc import Sequence
+from typing import Any, Literal
+from collections.abc import AsyncIterable, Callable, Iterable, Sequence
 import dataclasses
 import datetime
 from enum import Enum
@@ -11,9 +11,21 @@ from pathlib import Path
 import xlsxwriter
 import xlsxwriter.worksheet
 
-from .base_exporter import AttrSpec, BaseExporter, FallbackChain, NormalizedAttr
+try:
+    import rustpy_xlsxwriter
+except ImportError:
+    rustpy_xlsxwriter = None
 
-__all__ = ("ExcelExporter", "to_excel")
+from ._fast_xlsx import FastXlsxWriter
+from .base_exporter import AttrSpec, BaseExporter, FallbackChain, NormalizedAttr, _compile_path
+
+__all__ = ("ExcelEngine", "ExcelExporter", "to_excel", "to_excel_async")
+
+ExcelEngine = Literal["xlsxwriter", "fast_xml", "rustpy"]
+
+_MISSING: Any = object()
+# json.dumps builds a new encoder per call when ensure_ascii is changed; dict/list cells share this one
+_encode_json = json.JSONEncoder(ensure_ascii=False).encode
 
 
 class ExcelExporter(BaseExporter):
@@ -30,15 +42,23 @@ class ExcelExporter(BaseExporter):
     constant_memory: bool
         If True, enable xlsxwriter constant memory mode for streaming large
         files efficiently. Defaults to True.
+    engine: ExcelEngine
+        "xlsxwriter" (default) or "fast_xml", which writes the worksheet XML
+        directly into the zip archive. "fast_xml" is considerably faster for
+        very large exports but only supports a single plain sheet. "rustpy"
+        hands the rows to the optional Rust-based rustpy-xlsxwriter
+        (`pip install stagemarkt-api[excel]`); it keeps the converted rows in
+        memory until the sheet is closed and needs unique column labels.
     """
 
-    __slots__ = ("_constant_memory",)
+    __slots__ = ("_constant_memory", "_engine")
 
     def __init__(
         self,
         *,
         include_empty: bool = True,
         constant_memory: bool = True,
+        engine: ExcelEngine = "xlsxwriter",
     ) -> None:
         """
         Initialize the Excel exporter.
@@ -50,14 +70,21 @@ class ExcelExporter(BaseExporter):
         constant_memory: bool
             Whether to use constant_memory mode for xlsxwriter. This allows
             writing very large files with low memory usage. Default True.
+        engine: ExcelEngine
+            Which writer to use, "xlsxwriter", "fast_xml" or "rustpy". Default "xlsxwriter".
         """
+        if engine == "rustpy" and rustpy_xlsxwriter is None:
+            msg = "The 'rustpy' engine requires rustpy-xlsxwriter, install with: pip install stagemarkt-api[excel]"
+            raise RuntimeError(msg)
+
         super().__init__(include_empty=include_empty)
         self._constant_memory = constant_memory
+        self._engine = engine
 
     def export(
         self,
         path: Path,
-        objects: Sequence[object],
+        objects: Iterable[object],
         *,
         sheet_name: str = "Sheet1",
         names: tuple[str | None, list[AttrSpec]] | None = None,
@@ -65,12 +92,15 @@ class ExcelExporter(BaseExporter):
         """
         Export objects to an Excel file.
 
+        Objects are consumed one at a time and written directly to the
+        worksheet, so `objects` may be a generator.
+
         Parameters
         ----------
         path: Path
             Output file path.
-        objects: Sequence[object]
-            Sequence of objects to export.
+        objects: Iterable[object]
+            Objects to export.
         sheet_name: str
             Name of the worksheet. Default is "Sheet1".
         names: tuple[str | None, list[AttrSpec]] | None
@@ -82,27 +112,119 @@ class ExcelExporter(BaseExporter):
         None
             Writes the Excel file to `path`.
         """
-
-        if not objects:
+        iterator = iter(objects)
+        first = next(iterator, _MISSING)
+        if first is _MISSING:
             return
 
+        sheet = self._open_sheet(path, first, sheet_name=sheet_name, names=names)
+        try:
+            sheet.write(first)
+            for obj in iterator:
+                sheet.write(obj)
+        finally:
+            sheet.close()
+
+    async def export_async(
+        self,
+        path: Path,
+        objects: AsyncIterable[object],
+        *,
+        sheet_name: str = "Sheet1",
+        names: tuple[str | None, list[AttrSpec]] | None = None,
+    ) -> None:
+        """
+        Export objects from an async iterable to an Excel file.
+
+        Rows are written as soon as the objects arrive, e.g. from
+        `StagemarktClient.itereer_stages`, so the export starts before the
+        last page has been fetched.
+
+        Parameters
+        ----------
+        path: Path
+            Output file path.
+        objects: AsyncIterable[object]
+            Objects to export.
+        sheet_name: str
+            Name of the worksheet. Default is "Sheet1".
+        names: tuple[str | None, list[AttrSpec]] | None
+            Optional header title and attribute specifications to define
+            columns. If omitted, attributes are inferred from the first object.
+
+        Returns
+        -------
+        None
+            Writes the Excel file to `path`.
+        """
+        sheet: _Sheet | _FastSheet | _RustSheet | None = None
+        try:
+            async for obj in objects:
+                if sheet is None:
+                    sheet = self._open_sheet(path, obj, sheet_name=sheet_name, names=names)
+                sheet.write(obj)
+        finally:
+            if sheet is not None:
+                sheet.close()
+
+    def _open_sheet(
+        self,
+        path: Path,
+        first: object,
+        *,
+        sheet_name: str,
+        names: tuple[str | None, list[AttrSpec]] | None,
+    ) -> _Sheet | _FastSheet | _RustSheet:
+        """
+        Create the workbook, write the title and header rows and return a row writer.
+
+        Parameters
+        ----------
+        path: Path
+            Output file path.
+        first: object
+            The first object, used to infer attributes when `names` is None.
+        sheet_name: str
+            Name of the worksheet.
+        names: tuple[str | None, list[AttrSpec]] | None
+            Optional header title and attribute specifications.
+
+        Returns
+        -------
+        _Sheet | _FastSheet | _RustSheet
+            Writer positioned at the first data row.
+        """
         header_title: str | None = None
         attrs: list[AttrSpec] | None = None
         if names is not None:
             header_title, attrs = names
 
         attr_specs: Sequence[AttrSpec]
-        attr_specs = self._infer_attributes(objects[0]) if attrs is None else attrs
+        attr_specs = self._infer_attributes(first) if attrs is None else attrs
 
         normalized_attrs = self._normalize_attrs(attr_specs)
         headers = [label for label, _ in normalized_attrs]
 
-        workbook = xlsxwriter.Workbook(str(path), {"constant_memory": self._constant_memory})
+        if self._engine == "fast_xml":
+            writer = FastXlsxWriter(path, len(headers), sheet_name=sheet_name, title=header_title, headers=headers)
+            return _FastSheet(self, writer, normalized_attrs)
+
+        if self._engine == "rustpy":
+            return _RustSheet(self, path, normalized_attrs, sheet_name=sheet_name, title=header_title, headers=headers)
+
+        workbook = xlsxwriter.Workbook(
+            str(path),
+            {
+                "constant_memory": self._constant_memory,
+                "strings_to_numbers": False,
+                # Applied by xlsxwriter itself to date and datetime cells
+                "default_date_format": "yyyy-mm-dd hh:mm:ss",
+            },
+        )
         worksheet = workbook.add_worksheet(sheet_name)
 
         header_format = workbook.add_format({"bold": True})
         title_format = workbook.add_format({"bold": True, "align": "center"})
-        date_format = workbook.add_format({"num_format": "yyyy-mm-dd hh:mm:ss"})
 
         current_row = 0
         if header_title:
@@ -125,11 +247,7 @@ class ExcelExporter(BaseExporter):
 
         worksheet.freeze_panes(current_row, 0)
 
-        for row_idx, obj in enumerate(objects, start=current_row):
-            row_data = self._extract_row_data(obj, normalized_attrs)
-            self._write_row(worksheet, row_idx, row_data, date_format)
-
-        workbook.close()
+        return _Sheet(self, workbook, worksheet, normalized_attrs, current_row)
 
     def _infer_attributes(self, obj: Any) -> list[str]:
         """
@@ -160,76 +278,98 @@ class ExcelExporter(BaseExporter):
 
         return []
 
-    def _extract_row_data(
-        self,
-        obj: Any,
-        normalized_attrs: list[NormalizedAttr],
-        all_objects: Sequence[Any] | None = None,
-    ) -> list[Any]:
+    def _compile_row(self, normalized_attrs: list[NormalizedAttr]) -> Callable[[Any], list[Any]]:
         """
-        Extract data for a single row based on normalized attributes.
+        Build a function that extracts and converts the cells of one row.
+
+        Each column specification is inspected once here, so a row is only a
+        call per column followed by `_convert_cell_value`.
 
         Parameters
         ----------
-        obj: Any
-            The primary object to read values from.
         normalized_attrs: list[NormalizedAttr]
             Normalized attribute specifications.
-        all_objects: Sequence[Any] | None
-            Additional objects for multi-object attribute access.
 
         Returns
         -------
-        list[Any]
-            Row values ready for writing.
+        Callable[[Any], list[Any]]
+            Function mapping an object to its row values.
         """
-        objects_list = [obj] if all_objects is None else list(all_objects)
-        row: list[Any] = []
+        getters = [self._compile_column(indexed_paths) for _, indexed_paths in normalized_attrs]
+        convert = self._convert_cell_value
+
+        def row(obj: Any) -> list[Any]:
+            return [convert(get(obj)) for get in getters]
 
-        for _, indexed_paths in normalized_attrs:
-            # Handle callable transformer
-            if callable(indexed_paths):
+        return row
+
+    def _compile_column(
+        self,
+        indexed_paths: list[tuple[int, str]] | Callable[[Any], Any] | FallbackChain,
+    ) -> Callable[[Any], Any]:
+        """
+        Build a getter for a single column specification.
+
+        Parameters
+        ----------
+        indexed_paths: list[tuple[int, str]] | Callable[[Any], Any] | FallbackChain
+            The attribute specification of the column.
+
+        Returns
+        -------
+        Callable[[Any], Any]
+            Function returning the raw (unconverted) cell value for an object.
+        """
+        if callable(indexed_paths):
+            transformer = indexed_paths
+
+            def transformed(obj: Any) -> Any:
                 try:
-                    val = indexed_paths(obj)
-                except Exception:  # noqa: BLE001
-                    val = None
-                row.append(self._convert_cell_value(val))
-                continue
-
-            # Handle fallback chain
-            if isinstance(indexed_paths, FallbackChain):
+                    return transformer(obj)
+                except Exception:  # ruff: ignore[blind-except]
+                    return None
+
+            return transformed
+
+        if isinstance(indexed_paths, FallbackChain):
+            is_empty = self._is_empty
+            resolvers = [_compile_path(path) for _, path in indexed_paths.paths]
+
+            def first_filled(obj: Any) -> Any:
                 val = None
-                for obj_idx, path in indexed_paths.paths:
-                    target_obj = objects_list[obj_idx] if obj_idx < len(objects_list) else obj
-                    try:
-                        val = self._resolve_attribute(target_obj, path)
-                        if not self._is_empty(val):
-                            break
-                    except (AttributeError, KeyError):  # noqa: S112
-                        continue
-                row.append(self._convert_cell_value(val))
-                continue
-
-            if len(indexed_paths) == 1:
-                obj_idx, path = indexed_paths[0]
-                target_obj = objects_list[obj_idx] if obj_idx < len(objects_list) else obj
+                for resolve in resolvers:
+                    # Unresolvable paths already yield None, see `_compile_path`
+                    val = resolve(obj)
+                    if not is_empty(val):
+                        break
+                return val
+
+            return first_filled
+
+        if len(indexed_paths) == 1:
+            resolve = _compile_path(indexed_paths[0][1])
+
+            def single(obj: Any) -> Any:
                 try:
-                    val = self._resolve_attribute(target_obj, path)
+                    return resolve(obj)
                 except (AttributeError, KeyError):
-                    val = None
-                row.append(self._convert_cell_value(val))
-            else:
-                # Multiple paths - create dict with last segment as key
-                combined: dict[str, Any] = {}
-                for obj_idx, path in indexed_paths:
-                    target_obj = objects_list[obj_idx] if obj_idx < len(objects_list) else obj
-                    try:
-                        key = self._get_attr_key(path)
-                        combined[key] = self._resolve_attribute(target_obj, path)
-                    except (AttributeError, KeyError):
-                        combined[self._get_attr_key(path)] = None
-                row.append(self._convert_cell_value(combined))
-        return row
+                    return None
+
+            return single
+
+        # Multiple paths - create dict with last segment as key
+        keyed = [(self._get_attr_key(path), _compile_path(path)) for _, path in indexed_paths]
+
+        def combined(obj: Any) -> dict[str, Any]:
+            values: dict[str, Any] = {}
+            for key, resolve in keyed:
+                try:
+                    values[key] = resolve(obj)
+                except (AttributeError, KeyError):
+                    values[key] = None
+            return values
+
+        return combined
 
     def _convert_cell_value(self, val: Any) -> Any:
         """
@@ -245,9 +385,13 @@ class ExcelExporter(BaseExporter):
         Any
             A value suitable for xlsxwriter.
         """
-        if self._is_empty(val) and not self._include_empty:
+        if not self._include_empty and self._is_empty(val):
             return None
 
+        # Before the primitive check: IntEnum and StrEnum members are ints and strs too
+        if isinstance(val, Enum):
+            return val.value
+
         # Primitives supported by Excel
         if isinstance(val, (str, int, float, bool, type(None))):
             return val
@@ -255,18 +399,18 @@ class ExcelExporter(BaseExporter):
         if isinstance(val, (datetime.datetime, datetime.date)):
             return val  # xlsxwriter handles datetime objects
 
-        if isinstance(val, Enum):
-            return val.value
-
         if isinstance(val, (dict, list)):
-            return json.dumps(val, ensure_ascii=False)
+            return _encode_json(val)
 
         # Complex objects -> stringify
         return str(val)
 
-    def _write_row(self, worksheet: xlsxwriter.worksheet.Worksheet, row_idx: int, data: list[Any], date_format) -> None:
+    def _write_row(self, worksheet: xlsxwriter.worksheet.Worksheet, row_idx: int, data: list[Any]) -> None:
         """
-        Write a row of data, handling specific types.
+        Write a row of data.
+
+        xlsxwriter dispatches on each cell's type itself and applies the
+        workbook's ``default_date_format`` to date and datetime cells.
 
         Parameters
         ----------
@@ -276,31 +420,119 @@ class ExcelExporter(BaseExporter):
             Row index to write to.
         data: list[Any]
             Row values.
-        date_format: Any
-            xlsxwriter format for datetime cells.
 
         Returns
         -------
         None
         """
-        for col_idx, val in enumerate(data):
-            if isinstance(val, datetime.datetime):
-                worksheet.write_datetime(row_idx, col_idx, val, date_format)
-            elif isinstance(val, datetime.date):
-                dt_val = datetime.datetime.combine(val, datetime.time())
-                worksheet.write_datetime(row_idx, col_idx, dt_val, date_format)
-            else:
-                worksheet.write(row_idx, col_idx, val)
+        worksheet.write_row(row_idx, 0, data)
+
+
+class _Sheet:
+    """Writes rows to an open worksheet, one object at a time."""
+
+    __slots__ = ("_exporter", "_row", "_row_idx", "_workbook", "_worksheet")
+
+    def __init__(
+        self,
+        exporter: ExcelExporter,
+        workbook: xlsxwriter.Workbook,
+        worksheet: xlsxwriter.worksheet.Worksheet,
+        normalized_attrs: list[NormalizedAttr],
+        row_idx: int,
+    ) -> None:
+        self._exporter = exporter
+        self._workbook = workbook
+        self._worksheet = worksheet
+        self._row = exporter._compile_row(normalized_attrs)
+        self._row_idx = row_idx
+
+    def write(self, obj: object) -> None:
+        self._exporter._write_row(self._worksheet, self._row_idx, self._row(obj))
+        self._row_idx += 1
+
+    def close(self) -> None:
+        self._workbook.close()
+
+
+class _FastSheet:
+    """Writes rows through a :class:`FastXlsxWriter`, one object at a time."""
+
+    __slots__ = ("_row", "_writer")
+
+    def __init__(self, exporter: ExcelExporter, writer: FastXlsxWriter, normalized_attrs: list[NormalizedAttr]) -> None:
+        self._writer = writer
+        self._row = exporter._compile_row(normalized_attrs)
+
+    def write(self, obj: object) -> None:
+        self._writer.write_row(self._row(obj))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class _RustSheet:
+    """Collects converted rows for rustpy-xlsxwriter, which writes the whole sheet on close."""
+
+    __slots__ = ("_headers", "_path", "_row", "_rows", "_sheet_name", "_title")
+
+    def __init__(
+        self,
+        exporter: ExcelExporter,
+        path: Path,
+        normalized_attrs: list[NormalizedAttr],
+        *,
+        sheet_name: str,
+        title: str | None,
+        headers: list[str],
+    ) -> None:
+        # Rows are handed over as dicts keyed by label, so labels must be unique
+        if len(set(headers)) != len(headers):
+            msg = "The 'rustpy' engine requires unique column labels"
+            raise ValueError(msg)
+
+        self._path = path
+        self._sheet_name = sheet_name
+        self._title = title
+        self._headers = headers
+        self._row = exporter._compile_row(normalized_attrs)
+        self._rows: list[list[Any]] = []
+
+    def write(self, obj: object) -> None:
+        self._rows.append(self._row(obj))
+
+    def close(self) -> None:
+        headers = self._headers
+        header_row = 1 if self._title else 0
+        merge_ranges = None
+        # Like xlsxwriter's merge_range, a single column cannot hold a merged title
+        if self._title and len(headers) > 1:
+            title_format = rustpy_xlsxwriter.Format().set_bold().set_align("center")
+            merge_ranges = [(0, 0, 0, len(headers) - 1, self._title, title_format)]
+
+        rustpy_xlsxwriter.write_worksheet(
+            (dict(zip(headers, row, strict=True)) for row in self._rows),
+            str(self._path),
+            sheet_name=self._sheet_name,
+            freeze_row=header_row + 1,
+            datetime_format="yyyy-mm-dd hh:mm:ss",
+            autofit=False,
+            bold_headers=True,
+            header_row=header_row,
+            merge_ranges=merge_ranges,
+        )
+        self._rows = []
 
 
 def to_excel(
     *,
     path: Path,
-    objects: Sequence[object],
+    objects: Iterable[object],
     names: tuple[str | None, list[AttrSpec]] | None = None,
     sheet_name: str = "Sheet1",
     include_empty: bool = True,
     constant_memory: bool = True,
+    engine: ExcelEngine = "xlsxwriter",
 ) -> None:
     """
     Export objects to an Excel file.
@@ -311,7 +543,7 @@ def to_excel(
     ----------
     path: Path
         The file path to write the Excel file to.
-    objects: Sequence[object]
+    objects: Iterable[object]
         The objects to export.
     names: tuple[str | None, list[AttrSpec]] | None
         Optional header title and attribute specifications.
@@ -321,16 +553,65 @@ def to_excel(
         Whether to include empty values. Default is True.
     constant_memory: bool
         Whether to use constant memory mode for large files. Default is True.
+    engine: ExcelEngine
+        "xlsxwriter", or "fast_xml" / "rustpy" for very large exports. Default is "xlsxwriter".
 
     Returns
     -------
     None
         Writes the Excel file to `path`.
     """
-    exporter = ExcelExporter(include_empty=include_empty, constant_memory=constant_memory)
+    exporter = ExcelExporter(include_empty=include_empty, constant_memory=constant_memory, engine=engine)
     exporter.export(
         path,
         objects,
         sheet_name=sheet_name,
         names=names,
     )
+
+
+async def to_excel_async(
+    *,
+    path: Path,
+    objects: AsyncIterable[object],
+    names: tuple[str | None, list[AttrSpec]] | None = None,
+    sheet_name: str = "Sheet1",
+    include_empty: bool = True,
+    constant_memory: bool = True,
+    engine: ExcelEngine = "xlsxwriter",
+) -> None:
+    """
+    Export objects from an async iterable to an Excel file.
+
+    Convenience wrapper around ExcelExporter.export_async. Rows are written as
+    the objects arrive, for example from `StagemarktClient.itereer_stages`.
+
+    Parameters
+    ----------
+    path: Path
+        The file path to write the Excel file to.
+    objects: AsyncIterable[object]
+        The objects to export.
+    names: tuple[str | None, list[AttrSpec]] | None
+        Optional header title and attribute specifications.
+    sheet_name: str
+        The name of the worksheet. Default is "Sheet1".
+    include_empty: bool
+        Whether to include empty values. Default is True.
+    constant_memory: bool
+        Whether to use constant memory mode for large files. Default is True.
+    engine: ExcelEngine
+        "xlsxwriter", or "fast_xml" / "rustpy" for very large exports. Default is "xlsxwriter".
+
+    Returns
+    -------
+    None
+        Writes the Excel file to `path`.
+    """
+    exporter = ExcelExporter(include_empty=include_empty, constant_memory=constant_memory, engine=engine)
+    await exporter.export_async(
+        path,
+        objects,
+        sheet_name=sheet_name,
+        names=names,
+    )
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Final
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 import dataclasses
 import datetime
 from enum import Enum
+from functools import cache, partial
 from itertools import filterfalse
-import json
 from pathlib import Path
 
-from .base_exporter import AttrSpec, BaseExporter, FallbackChain
+from ..internals import _json
+from .base_exporter import AttrSpec, BaseExporter, FallbackChain, NormalizedAttr, _compile_path
 
 if TYPE_CHECKING:
     from _typeshed import SupportsWrite
@@ -19,15 +20,36 @@ __all__ = ("JSONExporter", "to_json")
 # Type aliases for clarity
 type JSONPrimitive = str | int | float | bool | None
 type JSONValue = JSONPrimitive | dict[str, Any] | list[Any]
+# Label and getter per attribute; the getter takes the object and the additional objects
+type AttrPlan = list[tuple[str, Callable[[Any, Sequence[Any]], Any]]]
+
+# Exact types only: IntEnum and StrEnum members are ints and strs too, but export as their value
+_PRIMITIVE_TYPES: Final[frozenset[type]] = frozenset({str, int, float, bool, type(None)})
+
+
+def _unchanged(value: Any) -> Any:
+    return value
+
+
+@cache
+def _public_fields(cls: type) -> tuple[str, ...]:
+    # The fields of a dataclass, like its slots, never change after the class is created
+    return tuple(f.name for f in dataclasses.fields(cls) if not f.name.startswith("_"))
+
+
+@cache
+def _public_slots(slots: frozenset[str]) -> tuple[str, ...]:
+    return tuple(s for s in slots if not s.startswith("_"))
 
 
 class JSONExporter(BaseExporter):
     """
     High-performance JSON exporter for Python objects.
 
-    Uses Python standard library for efficient serialization while supporting
-    complex objects (dataclasses, mappings, iterables, slotted objects, and
-    attribute-based extraction).
+    Uses `orjson` for serialization when it is installed and the options allow
+    it (compact output or an indent of 2, without `ensure_ascii`), and the
+    Python standard library otherwise. Supports complex objects (dataclasses,
+    mappings, iterables, slotted objects, and attribute-based extraction).
 
     Parameters
     ----------
@@ -41,7 +63,7 @@ class JSONExporter(BaseExporter):
         If True, escape non-ASCII characters. Defaults to False.
     """
 
-    __slots__ = ("_ensure_ascii", "_indent")
+    __slots__ = ("_ensure_ascii", "_handlers", "_indent", "_object_handlers")
 
     def __init__(
         self,
@@ -53,6 +75,22 @@ class JSONExporter(BaseExporter):
         super().__init__(include_empty=include_empty)
         self._indent: int | None = indent
         self._ensure_ascii: bool = ensure_ascii
+        # Handler per exact type, filled on first sight by `_find_handler`; None marks plain objects
+        self._handlers: dict[type, Callable[[Any], JSONValue] | None] = {
+            dict: self._convert_mapping,
+            list: self._convert_iterable,
+            tuple: self._convert_iterable,
+            set: self._convert_iterable,
+            frozenset: self._convert_iterable,
+            datetime.datetime: self._convert_datetime,
+            datetime.date: self._convert_datetime,
+            datetime.time: self._convert_datetime,
+            datetime.timedelta: self._convert_timedelta,
+            bytes: self._convert_bytes,
+            bytearray: self._convert_bytes,
+        }
+        # Handler per exact type for plain objects converted without `attrs`
+        self._object_handlers: dict[type, Callable[[Any], JSONValue]] = {}
 
     def export(
         self,
@@ -83,9 +121,8 @@ class JSONExporter(BaseExporter):
         None
             Writes the JSON to `path`.
         """
-        data = self._build_output(objects, root_key, attrs)
-        with path.open("w", encoding="utf-8") as f:
-            self._dump(data, f)
+        with path.open("wb") as fp:
+            fp.writelines(self._iter_encoded(objects, root_key, attrs))
 
     def dump(
         self,
@@ -114,8 +151,8 @@ class JSONExporter(BaseExporter):
         None
             Writes JSON content to `fp`.
         """
-        data = self._build_output(objects, root_key, attrs)
-        self._dump(data, fp)
+        for chunk in self._iter_encoded(objects, root_key, attrs):
+            fp.write(chunk.decode("utf-8"))
 
     def dumps(
         self,
@@ -142,11 +179,7 @@ class JSONExporter(BaseExporter):
             The JSON string.
         """
         data = self._build_output(objects, root_key, attrs)
-        return json.dumps(
-            data,
-            ensure_ascii=self._ensure_ascii,
-            indent=self._indent,
-        )
+        return self._encode(data).decode("utf-8")
 
     def serialize(self, obj: Any, attrs: list[AttrSpec] | None = None, objects: Sequence[Any] | None = None) -> JSONValue:
         """
@@ -191,32 +224,96 @@ class JSONExporter(BaseExporter):
         JSONValue
             Either a list of items or a dict with `root_key`.
         """
-        items = [self._convert(obj, attrs) for obj in objects]
+        # Compile the specs once instead of inspecting them for every object
+        plan = self._compile_attrs(self._normalize_attrs(attrs)) if attrs is not None else None
+        items = [self._convert(obj, attrs, plan=plan) for obj in objects]
         return {root_key: items} if root_key else items
 
-    def _dump(self, data: JSONValue, fp: SupportsWrite[str]) -> None:
+    def _iter_encoded(
+        self,
+        objects: Sequence[object],
+        root_key: str | None,
+        attrs: list[AttrSpec] | None,
+    ) -> Iterator[bytes]:
         """
-        Write JSON to file-like object with configured options.
+        Encode the output of `_build_output` piece by piece.
+
+        Each object is converted and encoded on its own, so only one converted
+        object is held in memory at a time. The concatenated chunks equal
+        `_encode(_build_output(...))`.
+
+        Parameters
+        ----------
+        objects: Sequence[object]
+            Objects to serialize.
+        root_key: str | None
+            Optional root key to wrap the serialized list.
+        attrs: list[AttrSpec] | None
+            Attribute specifications to extract.
+
+        Yields
+        ------
+        bytes
+            Consecutive chunks of the encoded JSON.
+        """
+        indent = self._indent
+        if indent is None:
+            # orjson writes compact separators, the standard library adds a space
+            compact = _json.uses_orjson(indent=indent, ensure_ascii=self._ensure_ascii)
+            item_sep, key_sep = (b",", b":") if compact else (b", ", b": ")
+            open_, item_prefix, close = b"[", b"", b"]"
+            if root_key:
+                open_, close = b"{" + self._encode(root_key) + key_sep + b"[", b"]}"
+        else:
+            pad = b" " * indent
+            item_sep, item_prefix, close = b",", b"\n" + pad, b"]"
+            open_ = b"["
+            if root_key:
+                open_ = b"{\n" + pad + self._encode(root_key) + b": ["
+                item_prefix += pad
+                close = b"]\n}"
+
+        plan = self._compile_attrs(self._normalize_attrs(attrs)) if attrs is not None else None
+
+        yield open_
+        sep = b""
+        for obj in objects:
+            encoded = self._encode(self._convert(obj, attrs, plan=plan))
+            if item_prefix:
+                # Encoded strings never contain a raw newline, so this only re-indents lines
+                encoded = item_prefix + encoded.replace(b"\n", item_prefix)
+            yield sep + encoded
+            sep = item_sep
+
+        if sep and indent is not None:
+            # The closing bracket goes on its own line, one level up from the items
+            yield item_prefix[: len(item_prefix) - indent]
+        yield close
+
+    def _encode(self, data: JSONValue) -> bytes:
+        """
+        Encode JSON-compatible data to UTF-8 bytes with configured options.
 
         Parameters
         ----------
         data: JSONValue
-            The JSON-compatible data to write.
-        fp: SupportsWrite[str]
-            A file-like object with a `.write(str)` method.
+            The JSON-compatible data to encode.
 
         Returns
         -------
-        None
+        bytes
+            The encoded JSON.
         """
-        json.dump(
-            data,
-            fp,
-            ensure_ascii=self._ensure_ascii,
-            indent=self._indent,
-        )
+        return _json.dumps(data, indent=self._indent, ensure_ascii=self._ensure_ascii)
 
-    def _convert(self, obj: Any, attrs: list[AttrSpec] | None = None, objects: Sequence[Any] | None = None) -> JSONValue:
+    def _convert(
+        self,
+        obj: Any,
+        attrs: list[AttrSpec] | None = None,
+        objects: Sequence[Any] | None = None,
+        *,
+        plan: AttrPlan | None = None,
+    ) -> JSONValue:
         """
         Convert any object to a JSON-compatible value.
 
@@ -228,6 +325,8 @@ class JSONExporter(BaseExporter):
             Attribute specifications.
         objects: Sequence[Any] | None
             Additional objects for multi-object attribute access.
+        plan: AttrPlan | None
+            `attrs` already compiled by `_compile_attrs`, if available.
 
         Returns
         -------
@@ -235,51 +334,101 @@ class JSONExporter(BaseExporter):
             A JSON-compatible value.
         """
         # Fast path: primitives (most common case)
-        if isinstance(obj, self._PRIMITIVES):
+        if type(obj) in _PRIMITIVE_TYPES:
             return obj
 
+        cls = type(obj)
+        try:
+            handler = self._handlers[cls]
+        except KeyError:
+            handler = self._handlers[cls] = self._find_handler(cls)
+        if handler is not None:
+            return handler(obj)
+
+        # Specific attributes requested
+        if attrs is not None:
+            return self._convert_with_attrs(obj, attrs, objects, plan=plan)
+
+        try:
+            object_handler = self._object_handlers[cls]
+        except KeyError:
+            object_handler = self._object_handlers[cls] = self._find_object_handler(obj)
+        return object_handler(obj)
+
+    def _find_handler(self, cls: type) -> Callable[[Any], JSONValue] | None:
+        """
+        Pick the converter for values of a non-primitive type.
+
+        The decision only depends on the type, so `_convert` caches it per type.
+
+        Parameters
+        ----------
+        cls: type
+            Type of the value.
+
+        Returns
+        -------
+        Callable[[Any], JSONValue] | None
+            The converter, or None for plain objects that depend on `attrs`.
+        """
         # Enums
-        if isinstance(obj, Enum):
-            return self._convert_enum(obj)
+        if issubclass(cls, Enum):
+            return self._convert_enum
+
+        # Other subclasses of primitives are already JSON-compatible
+        if issubclass(cls, self._PRIMITIVES):
+            return _unchanged
 
         # Datetime types
-        if isinstance(obj, self._DATETIME_TYPES):
-            return self._convert_datetime(obj)
+        if issubclass(cls, self._DATETIME_TYPES):
+            return self._convert_datetime
 
         # Timedelta
-        if isinstance(obj, datetime.timedelta):
-            return self._convert_timedelta(obj)
+        if issubclass(cls, datetime.timedelta):
+            return self._convert_timedelta
 
         # Bytes
-        if isinstance(obj, self._BYTES_TYPES):
-            return self._convert_bytes(obj)
+        if issubclass(cls, self._BYTES_TYPES):
+            return self._convert_bytes
 
-        if isinstance(obj, Mapping):
-            return self._convert_mapping(obj)
+        if issubclass(cls, Mapping):
+            return self._convert_mapping
 
         # Iterables (list, tuple, set, etc.)
-        if isinstance(obj, Iterable):
-            return self._convert_iterable(obj)
+        if issubclass(cls, Iterable):
+            return self._convert_iterable
 
-        # Specific attributes requested
-        if attrs is not None:
-            return self._convert_with_attrs(obj, attrs, objects)
+        return None
 
+    def _find_object_handler(self, obj: Any) -> Callable[[Any], JSONValue]:
+        """
+        Pick the converter for a plain object without `attrs`.
+
+        Parameters
+        ----------
+        obj: Any
+            First object of its type; the result is cached for the type.
+
+        Returns
+        -------
+        Callable[[Any], JSONValue]
+            The converter.
+        """
         # Dataclasses
         if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
-            return self._convert_dataclass(obj)
+            return self._convert_dataclass
 
         # Slotted objects
         slots = self._get_slots_cached(type(obj))
         if slots:
-            return self._convert_slotted(obj, slots)
+            return partial(self._convert_slotted, slots=slots)
 
         # Objects with __dict__
         if hasattr(obj, "__dict__"):
-            return self._convert_dict_obj(obj)
+            return self._convert_dict_obj
 
         # Fallback: string representation
-        return str(obj)
+        return str
 
     def _convert_mapping(self, obj: Mapping[Any, Any]) -> dict[str, Any]:
         """
@@ -295,8 +444,7 @@ class JSONExporter(BaseExporter):
         dict[str, Any]
             Converted dictionary.
         """
-        result = {str(k): self._convert(v) for k, v in obj.items()}
-        return self._filter_dict(result)
+        return self._convert_items(zip(map(str, obj.keys()), obj.values(), strict=True))
 
     def _convert_iterable(self, obj: Iterable[Any]) -> list[Any]:
         """
@@ -319,7 +467,14 @@ class JSONExporter(BaseExporter):
         # Use filterfalse with _is_empty for filtering
         return list(filterfalse(self._is_empty, converted))
 
-    def _convert_with_attrs(self, obj: Any, attrs: list[AttrSpec], objects: Sequence[Any] | None = None) -> dict[str, Any]:
+    def _convert_with_attrs(
+        self,
+        obj: Any,
+        attrs: list[AttrSpec],
+        objects: Sequence[Any] | None = None,
+        *,
+        plan: AttrPlan | None = None,
+    ) -> dict[str, Any]:
         """
         Convert object extracting only specified attributes.
 
@@ -331,6 +486,8 @@ class JSONExporter(BaseExporter):
             Attribute specifications to extract.
         objects: Sequence[Any] | None
             Additional objects for multi-object attribute access.
+        plan: AttrPlan | None
+            `attrs` already compiled by `_compile_attrs`, if available.
 
         Returns
         -------
@@ -338,51 +495,109 @@ class JSONExporter(BaseExporter):
             Dictionary of extracted attributes.
         """
         result: dict[str, Any] = {}
-        all_objects = [obj] if objects is None else list(objects)
+        all_objects = (obj,) if objects is None else objects
 
-        for label, indexed_paths in self._normalize_attrs(attrs):
-            # Handle callable transformer
-            if callable(indexed_paths):
-                try:
-                    value = self._convert(indexed_paths(obj))
-                except Exception:
-                    value = None
-                if self._should_include(value):
-                    result[label] = value
-                continue
-
-            # Handle fallback chain
-            if isinstance(indexed_paths, FallbackChain):
-                value = None
-                for obj_idx, path in indexed_paths.paths:
-                    target_obj = all_objects[obj_idx] if obj_idx < len(all_objects) else obj
-                    try:
-                        value = self._convert(self._resolve_attribute(target_obj, path))
-                        if not self._is_empty(value):
-                            break
-                    except (AttributeError, KeyError):  # noqa: S112
-                        continue
-                if self._should_include(value):
-                    result[label] = value
-                continue
-
-            if len(indexed_paths) == 1:
-                obj_idx, path = indexed_paths[0]
-                target_obj = all_objects[obj_idx] if obj_idx < len(all_objects) else obj
-                value = self._convert(self._resolve_attribute(target_obj, path))
-            else:
-                # Multiple paths - create dict with last segment as key
-                value = {}
-                for obj_idx, path in indexed_paths:
-                    target_obj = all_objects[obj_idx] if obj_idx < len(all_objects) else obj
-                    key = self._get_attr_key(path)
-                    value[key] = self._convert(self._resolve_attribute(target_obj, path))
-
-            if self._should_include(value):
+        if plan is None:
+            plan = self._compile_attrs(self._normalize_attrs(attrs))
+
+        # Loop-invariant: decide once whether empty values are filtered
+        include_empty = self._include_empty
+        is_empty = self._is_empty
+
+        for label, get in plan:
+            value = get(obj, all_objects)
+            if include_empty or not is_empty(value):
                 result[label] = value
 
         return result
 
+    def _compile_attrs(self, normalized: list[NormalizedAttr]) -> AttrPlan:
+        """
+        Build a getter for every attribute specification.
+
+        Each specification is inspected once here instead of for every object.
+        A getter returns the converted value, exactly as `_convert_with_attrs`
+        would store it before filtering empty values.
+
+        Parameters
+        ----------
+        normalized: list[NormalizedAttr]
+            Normalized attribute specifications.
+
+        Returns
+        -------
+        AttrPlan
+            Label and getter per attribute.
+        """
+        return [(label, self._compile_attr(indexed_paths)) for label, indexed_paths in normalized]
+
+    def _compile_attr(
+        self,
+        indexed_paths: list[tuple[int, str]] | Callable[[Any], Any] | FallbackChain,
+    ) -> Callable[[Any, Sequence[Any]], Any]:
+        """
+        Build a getter for a single attribute specification.
+
+        Parameters
+        ----------
+        indexed_paths: list[tuple[int, str]] | Callable[[Any], Any] | FallbackChain
+            The attribute specification.
+
+        Returns
+        -------
+        Callable[[Any, Sequence[Any]], Any]
+            Function taking the object and the additional objects, returning the converted value.
+        """
+        convert = self._convert
+
+        # Handle callable transformer
+        if callable(indexed_paths):
+            transformer = indexed_paths
+
+            def transformed(obj: Any, objects: Sequence[Any]) -> Any:
+                try:
+                    return convert(transformer(obj))
+                except Exception:  # ruff: ignore[blind-except]
+                    return None
+
+            return transformed
+
+        # Handle fallback chain
+        if isinstance(indexed_paths, FallbackChain):
+            is_empty = self._is_empty
+            resolvers = [(obj_idx, _compile_path(path)) for obj_idx, path in indexed_paths.paths]
+
+            def first_filled(obj: Any, objects: Sequence[Any]) -> Any:
+                value = None
+                for obj_idx, resolve in resolvers:
+                    target_obj = objects[obj_idx] if obj_idx < len(objects) else obj
+                    # Unresolvable paths already yield None, see `_compile_path`
+                    value = convert(resolve(target_obj))
+                    if not is_empty(value):
+                        break
+                return value
+
+            return first_filled
+
+        if len(indexed_paths) == 1:
+            obj_idx, path = indexed_paths[0]
+            resolve = _compile_path(path)
+
+            def single(obj: Any, objects: Sequence[Any]) -> Any:
+                return convert(resolve(objects[obj_idx] if obj_idx < len(objects) else obj))
+
+            return single
+
+        # Multiple paths - create dict with last segment as key
+        keyed = [(obj_idx, self._get_attr_key(path), _compile_path(path)) for obj_idx, path in indexed_paths]
+
+        def combined(obj: Any, objects: Sequence[Any]) -> dict[str, Any]:
+            return {
+                key: convert(resolve(objects[obj_idx] if obj_idx < len(objects) else obj)) for obj_idx, key, resolve in keyed
+            }
+
+        return combined
+
     def _convert_dataclass(self, obj: Any) -> dict[str, Any]:
         """
         Convert dataclass using `dataclasses.fields()` introspection.
@@ -397,9 +612,7 @@ class JSONExporter(BaseExporter):
         dict[str, Any]
             Converted dictionary of public fields.
         """
-        fields = dataclasses.fields(obj)
-        result = {f.name: self._convert(getattr(obj, f.name)) for f in fields if not f.name.startswith("_")}
-        return self._filter_dict(result)
+        return self._convert_items((name, getattr(obj, name)) for name in _public_fields(type(obj)))
 
     def _convert_slotted(self, obj: Any, slots: frozenset[str]) -> dict[str, Any]:
         """
@@ -417,9 +630,7 @@ class JSONExporter(BaseExporter):
         dict[str, Any]
             Converted dictionary of public slots.
         """
-        public_slots = (s for s in slots if not s.startswith("_"))
-        result = {slot: self._convert(getattr(obj, slot)) for slot in public_slots if hasattr(obj, slot)}
-        return self._filter_dict(result)
+        return self._convert_items((slot, getattr(obj, slot)) for slot in _public_slots(slots) if hasattr(obj, slot))
 
     def _convert_dict_obj(self, obj: Any) -> dict[str, Any]:
         """
@@ -435,26 +646,35 @@ class JSONExporter(BaseExporter):
         dict[str, Any]
             Converted dictionary of public attributes.
         """
-        result = {k: self._convert(v) for k, v in vars(obj).items() if not k.startswith("_")}
-        return self._filter_dict(result)
+        return self._convert_items((k, v) for k, v in vars(obj).items() if not k.startswith("_"))
 
-    def _filter_dict(self, d: dict[str, Any]) -> dict[str, Any]:
+    def _convert_items(self, items: Iterable[tuple[str, Any]]) -> dict[str, Any]:
         """
-        Filter dictionary based on include_empty setting.
+        Build a dict of converted values, leaving out empty ones unless `include_empty` is set.
+
+        Converting and filtering happen in one pass, so no intermediate dict is built.
 
         Parameters
         ----------
-        d: dict[str, Any]
-            Input dictionary.
+        items: Iterable[tuple[str, Any]]
+            Key and unconverted value pairs.
 
         Returns
         -------
         dict[str, Any]
-            Filtered dictionary.
+            Converted dictionary.
         """
+        convert = self._convert
         if self._include_empty:
-            return d
-        return {k: v for k, v in d.items() if self._should_include(v)}
+            return {k: convert(v) for k, v in items}
+
+        is_empty = self._is_empty
+        result: dict[str, Any] = {}
+        for k, v in items:
+            value = convert(v)
+            if not is_empty(value):
+                result[k] = value
+        return result
 
 
 def to_json(
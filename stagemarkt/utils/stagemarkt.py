@@ -2,9 +2,27 @@
 
 from __future__ import annotations
 
-from urllib.parse import quote_plus, urlencode
+from collections.abc import Callable
+from functools import lru_cache
+from urllib.parse import quote_plus
 
-__all__ = ("maak_stagemarkt_link",)
+__all__ = ("maak_stagemarkt_link", "maak_stagemarkt_link_factory")
+
+_BASE_URL = "https://stagemarkt.nl/stages"
+
+
+# Veel educaties in één export delen dezelfde titel
+@lru_cache(maxsize=1024)
+def _titel_slug(titel: str) -> str:
+    return quote_plus(titel.lower().replace("/", "-").replace(" ", "-"))
+
+
+def _query_string(*, niveau: int, educatie_type: int, straal: int, crebocode: int, plaats_postcode: str) -> str:
+    # Vaste ASCII-sleutels en integers hoeven niet gequote te worden; alleen de plaats/postcode wel
+    return (
+        f"niveau={niveau}&type={educatie_type}&range={straal}&crebocode={crebocode}"
+        f"&plaatsPostcode={quote_plus(plaats_postcode)}"
+    )
 
 
 def maak_stagemarkt_link(
@@ -54,19 +72,71 @@ def maak_stagemarkt_link(
     ... )
     'https://stagemarkt.nl/stages/software-developer_abc-123?niveau=4&type=1&range=25&crebocode=25998&plaatsPostcode=Amsterdam'
     """
-    titel_slug = titel.lower().replace("/", "-").replace(" ", "-")
-    titel_slug = quote_plus(titel_slug)
+    query_string = _query_string(
+        niveau=niveau,
+        educatie_type=educatie_type,
+        straal=straal,
+        crebocode=crebocode,
+        plaats_postcode=plaats_postcode,
+    )
+
+    return f"{_BASE_URL}/{_titel_slug(titel)}_{educatie_id}?{query_string}"
+
+
+def maak_stagemarkt_link_factory(
+    *,
+    niveau: int,
+    educatie_type: int,
+    straal: int,
+    crebocode: int,
+    plaats_postcode: str,
+) -> Callable[[str, str], str]:
+    """Maak een functie die Stagemarkt links maakt voor één zoekopdracht.
+
+    De zoekparameters zijn voor alle educaties in een export gelijk; de
+    querystring wordt daarom één keer opgebouwd en per link alleen de titel
+    en het ID ingevuld. De links zijn gelijk aan die van
+    :func:`maak_stagemarkt_link`.
+
+    Parameters
+    ----------
+    niveau: int
+        Opleidingsniveau.
+    educatie_type: int
+        Type educatie.
+    straal: int
+        Zoekstraal in kilometers.
+    crebocode: int
+        CREBO-code van de opleiding.
+    plaats_postcode: str
+        Plaats of postcode.
 
-    base_url = f"https://stagemarkt.nl/stages/{titel_slug}_{educatie_id}"
+    Returns
+    -------
+    Callable[[str, str], str]
+        Functie die ``(educatie_id, titel)`` omzet naar een volledige Stagemarkt URL.
 
-    params = {
-        "niveau": niveau,
-        "type": educatie_type,
-        "range": straal,
-        "crebocode": crebocode,
-        "plaatsPostcode": plaats_postcode,
-    }
+    Examples
+    --------
+    >>> maak_link = maak_stagemarkt_link_factory(
+    ...     niveau=4,
+    ...     educatie_type=1,
+    ...     straal=25,
+    ...     crebocode=25998,
+    ...     plaats_postcode="Amsterdam"
+    ... )
+    >>> maak_link("abc-123", "Software Developer")
+    'https://stagemarkt.nl/stages/software-developer_abc-123?niveau=4&type=1&range=25&crebocode=25998&plaatsPostcode=Amsterdam'
+    """
+    query_string = _query_string(
+        niveau=niveau,
+        educatie_type=educatie_type,
+        straal=straal,
+        crebocode=crebocode,
+        plaats_postcode=plaats_postcode,
+    )
 
-    query_string = urlencode(params)
+    def maak_link(educatie_id: str, titel: str) -> str:
+        return f"{_BASE_URL}/{_titel_slug(titel)}_{educatie_id}?{query_string}"
 
-    return f"{base_url}?{query_string}"
+    return maak_link
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+import asyncio
+import time
+
+import aiohttp
+import pytest
+
+from stagemarkt.cache import MemoryCache, ResponseCache
+from stagemarkt.internals.http import HTTPClient, _Antwoord
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+URL = "https://stagemarkt.nl/api/query-hub/education-search"
+PARAMS = {"niveau": 4, "plaatsPostcode": "Utrecht"}
+
+
+class FakeServer:
+    """Vervangt de netwerklaag van `HTTPClient` en onthoudt de verzoeken."""
+
+    def __init__(self, *responses: _Antwoord | Exception) -> None:
+        self.responses = list(responses)
+        self.requests: list[dict[str, str]] = []
+
+    async def get(self, url: str, params: Any, headers: dict[str, str]) -> _Antwoord:
+        self.requests.append(headers)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _request(client: HTTPClient) -> Any:
+    return asyncio.run(client.request(URL, params=PARAMS, policy="short"))
+
+
+def _client(monkeypatch: pytest.MonkeyPatch, cache: ResponseCache, server: FakeServer) -> HTTPClient:
+    # Een gebonden methode als klasse-attribuut wordt niet opnieuw aan de client gebonden
+    monkeypatch.setattr(HTTPClient, "_HTTPClient__get", server.get)
+    return HTTPClient(cache=cache, max_retries=0)
+
+
+def test_response_cache_fresh_entry_skips_request(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    server = FakeServer(_Antwoord(200, b'{"items": [1]}', None, None))
+    client = _client(monkeypatch, ResponseCache(tmp_path), server)
+
+    assert _request(client) == {"items": [1]}
+    assert _request(client) == {"items": [1]}
+    assert len(server.requests) == 1
+
+
+def test_response_cache_stale_entry_is_fallback_on_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    server = FakeServer(
+        _Antwoord(200, b'{"items": [1]}', None, None),
+        aiohttp.ClientConnectionError("weg"),
+        aiohttp.ClientConnectionError("weg"),
+    )
+    cache = ResponseCache(tmp_path, ttl={"short": 0.0})
+    client = _client(monkeypatch, cache, server)
+
+    assert _request(client) == {"items": [1]}
+    assert _request(client) == {"items": [1]}
+
+    cache.fallback_window = 0.0
+    with pytest.raises(aiohttp.ClientConnectionError):
+        _request(client)
+
+
+def test_response_cache_revalidates_with_304(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    server = FakeServer(
+        _Antwoord(200, b'{"items": [1]}', '"v1"', "Wed, 01 Jan 2025 00:00:00 GMT"),
+        _Antwoord(304, b"", None, None),
+    )
+    cache = ResponseCache(tmp_path, ttl={"short": 0.0})
+    client = _client(monkeypatch, cache, server)
+
+    assert _request(client) == {"items": [1]}
+    assert _request(client) == {"items": [1]}
+    assert server.requests[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"}
+
+    entry = cache.get(ResponseCache.key(URL, PARAMS.items()))
+    assert entry is not None
+    assert (entry.status, entry.body, entry.etag) == (200, b'{"items": [1]}', '"v1"')
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_memory_cache_evicts_least_recently_used() -> None:
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    assert cache.get("a") == b"1"
+
+    cache.set("c", b"3")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+    assert len(cache) == 2
+
+
+def test_memory_cache_expires_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache = MemoryCache(ttl=10.0)
+    cache.set("a", b"1")
+
+    now += 9.9
+    assert cache.get("a") == b"1"
+    now += 0.1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_memory_cache_disabled_with_zero_size() -> None:
+    cache = MemoryCache(maxsize=0)
+    cache.set("a", b"1")
+    assert cache.get("a") is None
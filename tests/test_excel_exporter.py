@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from xml.etree import ElementTree
+import zipfile
+
+import pytest
+
+from stagemarkt.enums import Niveau
+from stagemarkt.models.organisation_detail import OrganisationDetailKwalificatie
+from stagemarkt.utils.base_exporter import AttrField
+from stagemarkt.utils.excel_exporter import ExcelEngine, to_excel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_NS = {"main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+def _numeric_cells(path: Path) -> list[str]:
+    with zipfile.ZipFile(path) as archive:
+        # Raises when the worksheet is not well-formed XML
+        root = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+
+    return [value.text or "" for value in root.iterfind(".//main:c/main:v", _NS) if value.text is not None]
+
+
+@pytest.mark.parametrize("engine", ["xlsxwriter", "fast_xml"])
+def test_intenum_column_is_written_as_number(tmp_path: Path, engine: ExcelEngine) -> None:
+    kwalificaties = [
+        OrganisationDetailKwalificatie({"crebocode": "25187", "kwalificatie": "Software developer", "niveau": 4}),
+        OrganisationDetailKwalificatie({"crebocode": "25604", "kwalificatie": "Medewerker ICT", "niveau": 2}),
+    ]
+    path = tmp_path / "kwalificaties.xlsx"
+    to_excel(path=path, objects=kwalificaties, names=(None, [AttrField("Niveau", "niveau")]), engine=engine)
+
+    # xlsxwriter also stores the header as a <v> holding its shared string index
+    assert _numeric_cells(path)[-2:] == [str(Niveau.MBO_4.value), str(Niveau.MBO_2.value)]
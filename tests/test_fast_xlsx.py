@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+import datetime
+from xml.etree import ElementTree
+import zipfile
+
+from stagemarkt.enums import Niveau
+from stagemarkt.utils._fast_xlsx import FastXlsxWriter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_NS = {"main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+def _find(root: ElementTree.Element, path: str) -> ElementTree.Element:
+    found = root.find(path, _NS)
+    assert found is not None, path
+    return found
+
+
+def _write(path: Path) -> None:
+    writer = FastXlsxWriter(path, 3, sheet_name='Stages & "co"', title="Titel", headers=["Naam", "Aantal", "Start"])
+    writer.write_row(["<b>Bakker & Zn</b>", 3, datetime.datetime(2025, 1, 2, 12, 0, tzinfo=datetime.UTC)])
+    writer.write_row(["tab\tline\x01break", 2.5, datetime.date(2025, 1, 1)])
+    writer.write_row([None, Niveau.MBO_4, True])
+    writer.write_row(["", float("nan"), 10**20])
+    writer.close()
+
+
+def test_every_part_is_well_formed(tmp_path: Path) -> None:
+    path = tmp_path / "out.xlsx"
+    _write(path)
+
+    with zipfile.ZipFile(path) as archive:
+        assert archive.testzip() is None
+        names = set(archive.namelist())
+        assert {"[Content_Types].xml", "xl/workbook.xml", "xl/styles.xml", "xl/worksheets/sheet1.xml"} <= names
+        for name in names:
+            ElementTree.fromstring(archive.read(name))
+
+
+def test_cells_hold_the_written_values(tmp_path: Path) -> None:
+    path = tmp_path / "out.xlsx"
+    _write(path)
+
+    with zipfile.ZipFile(path) as archive:
+        sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+        workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+
+    def cell(ref: str) -> ElementTree.Element:
+        return _find(sheet, f".//main:c[@r='{ref}']")
+
+    def text(ref: str) -> str:
+        return "".join(cell(ref).itertext())
+
+    assert _find(workbook, ".//main:sheet").get("name") == 'Stages & "co"'
+    assert _find(sheet, ".//main:mergeCell").get("ref") == "A1:C1"
+    assert _find(sheet, ".//main:pane").get("topLeftCell") == "A3"
+
+    assert [text(ref) for ref in ("A1", "A2", "B2", "C2")] == ["Titel", "Naam", "Aantal", "Start"]
+    assert text("A3") == "<b>Bakker & Zn</b>"
+    assert text("B3") == "3"
+    # 2 januari 2025 12:00 is dag 45659,5 sinds het Excel-epoch
+    assert text("C3") == "45659.5"
+    assert cell("C3").get("s") == "3"
+
+    # Tekens die XML niet toestaat worden weggelaten
+    assert text("A4") == "tab\tlinebreak"
+    assert text("B4") == "2.5"
+    assert text("C4") == "45658.0"
+
+    assert sheet.find(".//main:c[@r='A5']", _NS) is None
+    assert text("B5") == "4"
+    assert (text("C5"), cell("C5").get("t")) == ("1", "b")
+
+    # Lege strings blijven leeg; niet-eindige getallen worden tekst
+    assert sheet.find(".//main:c[@r='A6']", _NS) is None
+    assert (text("B6"), cell("B6").get("t")) == ("nan", "inlineStr")
+    assert text("C6") == str(10**20)
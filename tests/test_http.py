@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import Any
+import asyncio
+
+import pytest
+
+from stagemarkt.internals.http import _MAX_WACHTTIJD, HTTPClient, Paginator, _Antwoord, _wachttijd
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "expected"),
+    [
+        ("5", 5.0),
+        ("0.5", 0.5),
+        ("-3", 0.0),
+        ("3600", _MAX_WACHTTIJD),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+    ],
+)
+def test_wachttijd_uses_retry_after(retry_after: str, expected: float) -> None:
+    assert _wachttijd({"Retry-After": retry_after}, 1) == expected
+
+
+@pytest.mark.parametrize("retry_after", ["nan", "inf", "-inf", "binnenkort", ""])
+def test_wachttijd_falls_back_to_exponential_delay(retry_after: str) -> None:
+    assert _wachttijd({"Retry-After": retry_after}, 3) == pytest.approx(4.0)
+
+
+def test_wachttijd_without_header_is_capped() -> None:
+    assert _wachttijd(None, 1) == pytest.approx(1.0)
+    assert _wachttijd({}, 20) == _MAX_WACHTTIJD
+
+
+class FakePages:
+    """Geeft `total_pages` pagina's terug en houdt bij hoeveel verzoeken tegelijk lopen."""
+
+    def __init__(self, total_pages: int, *, with_total: bool = True) -> None:
+        self.total_pages = total_pages
+        self.with_total = with_total
+        self.active = 0
+        self.max_active = 0
+        self.pages: list[int] = []
+
+    async def __call__(self, *, page_size: int, page: int) -> dict[str, Any]:
+        self.pages.append(page)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+        response: dict[str, Any] = {"items": [f"{page}-{i}" for i in range(page_size)]}
+        if self.with_total:
+            response["totalPages"] = self.total_pages
+        else:
+            response["hasNextPage"] = page < self.total_pages
+        return response
+
+
+@pytest.mark.parametrize("concurrency", [1, 3, 20])
+def test_collect_bounds_concurrent_pages(concurrency: int) -> None:
+    requester = FakePages(10)
+    paginator: Paginator[str, Any] = Paginator(requester, max_page_size=2, concurrency=concurrency)
+
+    items = asyncio.run(paginator.collect())
+
+    assert items == [f"{page}-{i}" for page in range(1, 11) for i in range(2)]
+    assert sorted(requester.pages) == list(range(1, 11))
+    # De eerste pagina gaat altijd alleen; daarna nooit meer dan `concurrency` tegelijk
+    assert requester.max_active == min(concurrency, 9)
+
+
+def test_collect_respects_limit() -> None:
+    requester = FakePages(10)
+    paginator: Paginator[str, Any] = Paginator(requester, limit=5, max_page_size=2)
+
+    items = asyncio.run(paginator.collect())
+
+    assert items == ["1-0", "1-1", "2-0", "2-1", "3-0"]
+    assert sorted(requester.pages) == [1, 2, 3]
+
+
+def test_collect_without_total_goes_page_by_page() -> None:
+    requester = FakePages(4, with_total=False)
+    paginator: Paginator[str, Any] = Paginator(requester, max_page_size=1, concurrency=4)
+
+    items = asyncio.run(paginator.collect())
+
+    assert items == ["1-0", "2-0", "3-0", "4-0"]
+    assert requester.max_active == 1
+
+
+def test_concurrent_detail_calls_share_one_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[str] = []
+
+    async def get(client: HTTPClient, url: str, params: list[tuple[str, Any]], headers: dict[str, str]) -> _Antwoord:
+        requests.append(dict(params)["id"])
+        await asyncio.sleep(0.01)
+        return _Antwoord(200, b'{"leerplaatsId": "1", "kenmerken": []}', None, None)
+
+    monkeypatch.setattr(HTTPClient, "_HTTPClient__get", get)
+    client = HTTPClient()
+    detail = client._HTTPClient__get_education_detail  # pyright: ignore[reportAttributeAccessIssue]
+
+    async def main() -> list[Any]:
+        return await asyncio.gather(detail(leerplaats_id="1"), detail(leerplaats_id="1"), detail(leerplaats_id="2"))
+
+    first, second, other = asyncio.run(main())
+
+    assert requests == ["1", "2"]
+    assert first == second == {"leerplaatsId": "1", "kenmerken": []}
+    # Elke aanroeper krijgt een eigen dict
+    assert first is not second
+    assert first["kenmerken"] is not second["kenmerken"]
+    assert other == first
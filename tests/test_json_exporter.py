@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import Any
+import dataclasses
+import datetime
+import json
+
+import pytest
+
+from stagemarkt.enums import Leerweg, Niveau
+from stagemarkt.internals import _json
+from stagemarkt.utils.base_exporter import AttrField, AttrSpec
+from stagemarkt.utils.json_exporter import JSONExporter
+
+
+@dataclasses.dataclass
+class Stage:
+    naam: str
+    niveau: Niveau
+    leerweg: Leerweg | None
+    start: datetime.date
+    tags: list[str]
+    extra: dict[str, Any]
+
+
+STAGES = [
+    Stage("Bakker & Zn", Niveau.MBO_4, Leerweg.BOL, datetime.date(2025, 1, 2), ["brood", "ëten"], {"a": 1}),
+    Stage("Zorg\ncentrum “De Linde”", Niveau.MBO_2, None, datetime.date(2025, 2, 3), [], {}),
+    Stage("", Niveau.MBO_1, Leerweg.BBL, datetime.date(2025, 3, 4), ["x"], {"genest": {"b": [1.5, None]}}),
+]
+
+
+def _expected(root_key: str | None) -> Any:
+    items = [
+        {
+            "naam": stage.naam,
+            "niveau": stage.niveau.value,
+            "leerweg": stage.leerweg.value if stage.leerweg else None,
+            "start": stage.start.isoformat(),
+            "tags": stage.tags,
+            "extra": stage.extra,
+        }
+        for stage in STAGES
+    ]
+    return {root_key: items} if root_key else items
+
+
+@pytest.mark.parametrize("indent", [None, 2, 4])
+@pytest.mark.parametrize("ensure_ascii", [False, True])
+@pytest.mark.parametrize("root_key", [None, "stages"])
+@pytest.mark.parametrize("objects", [STAGES, []], ids=["stages", "empty"])
+def test_streamed_output_matches_json_dumps(
+    indent: int | None, ensure_ascii: bool, root_key: str | None, objects: list[Stage]
+) -> None:
+    exporter = JSONExporter(indent=indent, ensure_ascii=ensure_ascii)
+    streamed = b"".join(exporter._iter_encoded(objects, root_key, None))
+
+    expected = _expected(root_key) if objects else ({root_key: []} if root_key else [])
+    assert json.loads(streamed) == expected
+    # Streamen en in één keer encoderen geven dezelfde bytes
+    assert streamed.decode("utf-8") == exporter.dumps(objects, root_key=root_key)
+    if not _json.uses_orjson(indent=indent, ensure_ascii=ensure_ascii):
+        assert streamed.decode("utf-8") == json.dumps(expected, indent=indent, ensure_ascii=ensure_ascii)
+
+
+def test_streamed_output_with_attrs() -> None:
+    exporter = JSONExporter(indent=2)
+    attrs: list[AttrSpec] = [AttrField("Naam", "naam"), AttrField("Niveau", "niveau")]
+    streamed = b"".join(exporter._iter_encoded(STAGES, None, attrs))
+
+    assert json.loads(streamed) == [{"Naam": s.naam, "Niveau": s.niveau.value} for s in STAGES]
+
+
+def test_serialize_unwraps_enum_members() -> None:
+    value = JSONExporter().serialize([Niveau.MBO_4, Leerweg.BOL])
+
+    assert isinstance(value, list)
+    assert value == [4, Leerweg.BOL.value]
+    assert [type(item) for item in value] == [int, str]